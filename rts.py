@@ -1,4 +1,5 @@
 #!/usr/bin/env python
+import numpy as np
 import pandas as pd
 from argparse import ArgumentParser
 from rts.Helpers import *
@@ -25,7 +26,7 @@ def main():
     line = '\n' + '-' * 50 + '\n'
     sline = '-' * 50
 
-    def test(r): return f"Test success: {r}"
+    def test(r): return f"Test success: {bool(r)}"
     def stest(r, proc="pessimistic"): return ("Result: Task set is schedulable" if r else "Result: Task set is not schedulable") + " (" + proc + ")"
 
     print(f"\nResults for Task Set: {T}\n")
@@ -51,29 +52,34 @@ def main():
 
         print("[RMS] Liu-Layland-Test")
         llt = T.ll_test()
+        print(llt)
         print(stest(llt))
         print(line)
 
         print("[RMS] RMA Test")
-        rmat = T.rma_test()
+        rmat = T.rma_test(trace=True)
+        print(rmat)
         print(stest(rmat, "optimistic"))
         print(line)
 
         print("[RMS] Hyperbolic Bound")
         hb = T.hyperbolic_bound()
+        print(hb)
         print(stest(hb))
         print(line)
 
         print("[RMS] Burchard Test")
         bt = T.burchard_test()
+        print(bt)
         print(stest(bt))
         print(line)
 
         print("[RMS] SR-Test")
-        srt_df = pd.DataFrame(T.sr_test()).T
-        success = len(np.where(srt_df["u < 1"].isin(["True", True]))[0]) > 0
+        srt = T.sr_test()
+        srt_df = pd.DataFrame({"tbi": srt["tbi"], "p_mod": list(srt["p_mod"]), "u": srt["u"], "u < 1": srt["passed"]},
+                              index=[f"T{i}" for i in range(len(srt["u"]))])
         print(srt_df)
-        print(stest(success))
+        print(stest(srt))
         print(line)
 
         print("[EDF] u < 1 Test")
@@ -89,75 +95,80 @@ def main():
 
         print("RM Next Fit")
         rmnft = CPU.rmnf(T)
-        rmnf_df = pd.DataFrame(CPU.get_partitioning()).T
+        rmnf_df = rmnft.to_frame()
         print(rmnf_df)
+        print(f"Cores Necessary (N): {rmnft.cores}")
         print(f"Average Core Utilization: {round(np.mean(rmnf_df['u_rel']), 4) * 100}%")
         print(test(rmnft))
         print(line)
 
         print("RM First Fit")
         rmfft = CPU.rmff(T)
-        rmff_df = pd.DataFrame(CPU.get_partitioning()).T
+        rmff_df = rmfft.to_frame()
         print(rmff_df)
+        print(f"Cores Necessary (N): {rmfft.cores}")
         print(f"Average Core Utilization: {round(np.mean(rmff_df['u_rel']), 4) * 100}%")
         print(test(rmfft))
         print(line)
 
         print("RM First Fit with Decreasing Utilization")
         rmffdut = CPU.rmffdu(T)
-        rmffdu_df = pd.DataFrame(CPU.get_partitioning()).T
+        rmffdu_df = rmffdut.to_frame()
         print(rmffdu_df)
+        print(f"Cores Necessary (N): {rmffdut.cores}")
         print(f"Average Core Utilization: {round(np.mean(rmffdu_df['u_rel']), 4) * 100}%")
         print(test(rmffdut))
         print(line)
 
         print("RM Small Task")
         rmstt = CPU.rmst(T)
-        rmst_df = pd.DataFrame(CPU.get_partitioning()).T
+        rmst_df = rmstt.to_frame()
         print(rmst_df)
+        print(f"Cores Necessary (N): {rmstt.cores}")
         print(f"Average Core Utilization: {round(np.mean(rmst_df['u_rel']), 4) * 100}%")
         print(test(rmstt))
         print(line)
 
         # print("RM General Task")
         # rmgtt = CPU.rmgt(T)
-        # rmgt_df = pd.DataFrame(CPU.get_partitioning()).T
+        # rmgt_df = rmgtt.to_frame()
         # print(rmgt_df)
         # print(test(rmgtt))
         # print(line)
 
         # print("RM Best Fit")
         # rmbft = CPU.rmbf(T)
-        # rmbf_df = pd.DataFrame(CPU.get_partitioning()).T
+        # rmbf_df = rmbft.to_frame()
         # print(rmbf_df)
         # print(test(rmbft))
         # print(line)
 
         # print("RM Worst Fit")
         # rmwft = CPU.rmwf(T)
-        # rmwf_df = pd.DataFrame(CPU.get_partitioning()).T
+        # rmwf_df = rmwft.to_frame()
         # print(rmwf_df)
         # print(test(rmwft))
         # print(line)
 
         print("EDF Next Fit")
         edfnft = CPU.edfnf(T)
-        edfnf_df = pd.DataFrame(CPU.get_partitioning()).T
+        edfnf_df = edfnft.to_frame()
         print(edfnf_df)
+        print(f"Cores Necessary (N): {edfnft.cores}")
         print(f"Average Core Utilization: {round(np.mean(edfnf_df['u_rel']), 4) * 100}%")
         print(test(edfnft))
         # print(line)
 
         # print("EDF First Fit")
         # edffft = CPU.edfff(T)
-        # edfff_df = pd.DataFrame(CPU.get_partitioning()).T
+        # edfff_df = edffft.to_frame()
         # print(edfff_df)
         # print(test(edffft))
         # print(line)
 
         # print("EDF Best Fit")
         # edfbft = CPU.edfbf(T)
-        # edfbf_df = pd.DataFrame(CPU.get_partitioning()).T
+        # edfbf_df = edfbft.to_frame()
         # print(edfbf_df)
         # print(test(edfbft))
         print('\n')
@@ -170,26 +181,31 @@ def main():
 
         print("Adaptive TkC")
         atkct = CPU.adaptive_tkc(T)
+        print(atkct)
         print(test(atkct))
         print(line)
 
         print("RM Utilization Separation")
         rmust = CPU.rmus(T)
+        print(rmust)
         print(test(rmust))
         print(line)
 
         print("Global EDF")
         gedft = CPU.global_edf(T)
+        print(gedft)
         print(test(gedft))
         print(line)
 
         print("EDF Utilization Separation")
         edfust = CPU.edfus(T)
+        print(edfust)
         print(test(edfust))
         print(line)
 
         print("fpEDF")
         fpedft = CPU.fpedf(T)
+        print(fpedft)
         print(test(fpedft))
         print('\n')
 
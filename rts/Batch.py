@@ -0,0 +1,226 @@
+import numpy
+import multiprocessing
+import queue
+from multiprocessing.shared_memory import SharedMemory
+
+from .Processor import Processor
+from .Profiler import PROFILER
+from .Task import PTask
+from .TaskSet import TaskSet
+
+
+class SharedTaskSets:
+    """
+    Collection of task sets packed into shared memory
+
+    The parameters of all tasks are stored in one (4, n) array (rows p, e, d, fi), the task sets
+    are slices given by an offset array. Worker processes attach by name (see spec) without copying.
+
+    Parameters:
+
+        tasksets: list -> task sets (TaskSet or list of PTask)
+
+    Usage:
+
+        with SharedTaskSets(sets) as shared:
+            batch_test(shared, "tda_test", workers=64)
+    """
+    def __init__(self, tasksets):
+        sets = [T.taskset if isinstance(T, TaskSet) else list(T) for T in tasksets]
+        sizes = [len(tasks) for tasks in sets]
+        n = sum(sizes)
+
+        self.owner = True
+        self._shm_tasks, self.tasks = self._create((4, n), numpy.float64)
+        self._shm_offsets, self.offsets = self._create((len(sets) + 1,), numpy.int64)
+
+        self.offsets[0] = 0
+        self.offsets[1:] = numpy.cumsum(sizes)
+        self.tasks[:] = [[getattr(task, key) for tasks in sets for task in tasks] for key in ("p", "e", "d", "fi")]
+
+    @classmethod
+    def attach(cls, spec):
+        """
+        Attaches to task sets created by another process
+
+        Parameters:
+
+            spec: tuple -> SharedTaskSets.spec of the creating process
+        """
+        tasks_name, offsets_name, n, count = spec
+
+        self = cls.__new__(cls)
+        self.owner = False
+        self._shm_tasks, self.tasks = self._attach(tasks_name, (4, n), numpy.float64)
+        self._shm_offsets, self.offsets = self._attach(offsets_name, (count + 1,), numpy.int64)
+
+        return self
+
+    @property
+    def spec(self) -> tuple:
+        """
+        Names and sizes of the shared memory blocks (to attach from a worker)
+        """
+        return (self._shm_tasks.name, self._shm_offsets.name, self.tasks.shape[1], len(self))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> TaskSet:
+        a, b = self.offsets[i], self.offsets[i+1]
+        P, E, D, F = self.tasks[:, a:b].tolist()
+        return TaskSet(*[PTask(P[k], E[k], F[k], D[k]) for k in range(b - a)])
+
+    def close(self):
+        """
+        Detaches from shared memory (the creating process also frees it)
+        """
+        self.tasks = self.offsets = None
+        for shm in (self._shm_tasks, self._shm_offsets):
+            shm.close()
+            if self.owner:
+                shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @staticmethod
+    def _create(shape, dtype):
+        size = max(1, int(numpy.prod(shape)) * numpy.dtype(dtype).itemsize)
+        shm = SharedMemory(create=True, size=size)
+        return shm, numpy.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+    @staticmethod
+    def _attach(name: str, shape, dtype):
+        shm = SharedMemory(name=name)
+        return shm, numpy.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _run(job, T) -> tuple:
+    """
+    Returns (verdict, cores) of job for task set T (global procedures use all cores)
+    """
+    kind, name, core_count, kwargs = job
+
+    if kind == "test":
+        return bool(getattr(T, name)(**kwargs)), 1
+
+    r = getattr(Processor(core_count), name)(T, **kwargs)
+    return r.success, getattr(r, "cores", core_count)
+
+
+def _worker(spec, result_name: str, job, start: int, stride: int, profiles):
+    """
+    Processes task sets start, start + stride, ... and writes verdicts and core counts into the shared result array.
+    If profiles (queue) is given, the worker profiles its work and puts PROFILER.to_dict() into it.
+    """
+    if profiles is not None:
+        PROFILER.reset()
+        PROFILER.enable()
+
+    shared = SharedTaskSets.attach(spec)
+    shm, result = SharedTaskSets._attach(result_name, (len(shared), 2), numpy.int64)
+
+    try:
+        for i in range(start, len(shared), stride):
+            result[i] = _run(job, shared[i])
+    finally:
+        result = None
+        shm.close()
+        shared.close()
+        if profiles is not None:
+            profiles.put(PROFILER.to_dict())
+
+
+def _batch(sets, job, workers: int) -> numpy.ndarray:
+    """
+    Runs job for every task set on workers processes (strided slices), returns (count, 2) array of verdicts and core counts
+    """
+    shared = sets if isinstance(sets, SharedTaskSets) else SharedTaskSets(sets)
+    count = len(shared)
+
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    workers = max(1, min(workers, count))
+
+    shm, result = SharedTaskSets._create((count, 2), numpy.int64)
+
+    try:
+        if workers == 1:
+            for i in range(count):
+                result[i] = _run(job, shared[i])
+        else:
+            profiles = multiprocessing.Queue() if PROFILER.enabled else None
+            processes = [
+                multiprocessing.Process(target=_worker, args=(shared.spec, shm.name, job, k, workers, profiles))
+                for k in range(workers)
+            ]
+            for process in processes:
+                process.start()
+
+            # Profiles are collected before joining (a worker exits only after its queue is flushed)
+            received = 0
+            while profiles is not None and received < workers:
+                try:
+                    PROFILER.merge(profiles.get(timeout=0.1))
+                    received += 1
+                except queue.Empty:
+                    if not any(process.is_alive() for process in processes) and profiles.empty():
+                        break
+
+            for process in processes:
+                process.join()
+
+            failed = [process.exitcode for process in processes if process.exitcode != 0]
+            if failed:
+                raise RuntimeError(f"{len(failed)} batch worker(s) failed (exit codes {failed})")
+
+        return result.copy()
+    finally:
+        result = None
+        shm.close()
+        shm.unlink()
+        if shared is not sets:
+            shared.close()
+
+
+def batch_test(sets, test: str = "tda_test", workers: int = None, **kwargs) -> numpy.ndarray:
+    """
+    Runs a scheduling test of TaskSet for many task sets in parallel
+
+    Parameters:
+
+        sets: SharedTaskSets | list -> task sets (packed into shared memory if given as list)
+        test: str                   -> name of the TaskSet test, e.g. "ll_test", "tda_test" or "qpa_test", "tda_test" by default
+        workers: int                -> number of worker processes, number of CPUs by default (1: no processes)
+        kwargs: dict                -> further arguments of the test
+
+    Returns:
+
+        numpy.ndarray -> verdict per task set (bool)
+    """
+    return _batch(sets, ("test", test, 1, kwargs), workers)[:, 0].astype(bool)
+
+
+def batch_partition(sets, procedure: str = "rmffdu", core_count: int = 1, workers: int = None, **kwargs):
+    """
+    Runs a partitioning or global procedure of Processor for many task sets in parallel
+
+    Parameters:
+
+        sets: SharedTaskSets | list -> task sets (packed into shared memory if given as list)
+        procedure: str              -> name of the Processor procedure, e.g. "rmffdu", "optimal" or "global_edf", "rmffdu" by default
+        core_count: int             -> number of cores of the Processor, 1 by default
+        workers: int                -> number of worker processes, number of CPUs by default (1: no processes)
+        kwargs: dict                -> further arguments of the procedure
+
+    Returns:
+
+        (numpy.ndarray, numpy.ndarray) -> verdict per task set (bool), number of cores used per task set
+                                          (core_count for global procedures)
+    """
+    result = _batch(sets, ("partition", procedure, core_count, kwargs), workers)
+    return result[:, 0].astype(bool), result[:, 1]
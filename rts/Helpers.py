@@ -1,4 +1,68 @@
-import numpy as np
+import importlib.util
+import sys
+from fractions import Fraction
+from math import gcd
+
+
+def lazy_import(name: str):
+    """
+    Returns module name, loaded on first attribute access (e.g. numpy is only imported when
+    a vectorized code path is used)
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    return module
+
 
 def urm(n: int):
-    return n * (np.power(2, 1/n) - 1)
\ No newline at end of file
+    return n * (2 ** (1/n) - 1)
+
+
+# Liu-Layland bounds urm(k) for k = 0, 1, ... (extended by urm_table on demand)
+_URM_TABLE = [1.0]
+
+
+def urm_table(n: int) -> list:
+    """
+    Liu-Layland bounds for at least 0..n tasks as lookup table (urm_table(n)[k] = urm(k), 1 for k = 0).
+    The table is shared by all calls and only extended if n exceeds its size, do not modify it.
+    """
+    for k in range(len(_URM_TABLE), n + 1):
+        _URM_TABLE.append(k * (2 ** (1/k) - 1))
+    return _URM_TABLE
+
+
+def lcm(values) -> int:
+    """
+    Least common multiple of integers
+    """
+    res = 1
+    for v in values:
+        res = res * v // gcd(res, v)
+    return res
+
+
+def integer_scale(values, max_denominator: int = 10**6):
+    """
+    Converts (float) time values to integers
+
+    Parameters:
+
+        values: list            -> time values
+        max_denominator: int    -> max. denominator of the rational approximation of a value, 10^6 by default
+
+    Returns:
+
+        (list, int) -> values multiplied with a common factor as integers, common factor
+    """
+    fractions = [Fraction(v).limit_denominator(max_denominator) for v in values]
+    scale = lcm(f.denominator for f in fractions)
+    return [int(f * scale) for f in fractions], scale
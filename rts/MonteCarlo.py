@@ -0,0 +1,189 @@
+import numpy
+from statistics import NormalDist
+
+from .Batch import SharedTaskSets, batch_partition, batch_test
+from .Processor import Processor
+from .Result import Result
+from .Task import PTask
+from .TaskSet import TaskSet
+
+
+def uunifast(rng, n: int, U: float, discard: bool = True, max_draws: int = 1000) -> numpy.ndarray:
+    """
+    UUniFast (Bini-Buttazzo): n utilizations uniformly distributed with sum U
+
+    Parameters:
+
+        rng: numpy.random.Generator -> random number generator
+        n: int                      -> number of tasks
+        U: float                    -> total utilization
+        discard: bool               -> draw again while a utilization is > 1 (UUniFast-Discard for U > 1), True by default
+        max_draws: int              -> max. number of draws with discard, 1000 by default
+
+    Returns:
+
+        numpy.ndarray -> utilization per task
+
+    Raises:
+
+        ValueError -> if discard and U > n (no such utilizations exist) or no draw within max_draws is valid (U close to n)
+    """
+    if discard and U > n:
+        raise ValueError(f"Total utilization {U} exceeds number of tasks {n}")
+
+    for _ in range(max_draws if discard else 1):
+        s = U * numpy.cumprod(numpy.concatenate(([1.0], rng.random(n - 1) ** (1 / numpy.arange(n - 1, 0, -1)))))
+        u = s - numpy.concatenate((s[1:], [0.0]))
+        if not discard or u.max() <= 1:
+            return u
+
+    raise ValueError(f"No valid utilizations with total {U} for {n} tasks within {max_draws} draws")
+
+
+def random_taskset(rng, n: int, U: float, periods: tuple = (10, 1000)) -> TaskSet:
+    """
+    Random task set (UUniFast-Discard utilizations, integer periods log-uniform in periods, implicit deadlines)
+
+    Parameters:
+
+        rng: numpy.random.Generator -> random number generator
+        n: int                      -> number of tasks
+        U: float                    -> total utilization
+        periods: tuple              -> (min, max) period, (10, 1000) by default
+    """
+    u = uunifast(rng, n, U)
+    p = numpy.round(numpy.exp(rng.uniform(numpy.log(periods[0]), numpy.log(periods[1]), n)))
+    return TaskSet(*[PTask(float(p[k]), float(u[k] * p[k])) for k in range(n)])
+
+
+def wilson(k: int, n: int, confidence: float = 0.95) -> tuple:
+    """
+    Wilson score interval of a ratio of k successes in n samples
+
+    Returns:
+
+        (float, float) -> lower and upper bound
+    """
+    if n == 0:
+        return 0.0, 1.0
+
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    r = k / n
+    center = (r + z*z / (2*n)) / (1 + z*z / n)
+    half = z / (1 + z*z / n) * numpy.sqrt(r * (1 - r) / n + z*z / (4*n*n))
+
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def acceptance_ratio(procedure: str, utilizations, core_counts=1, n: int = 10, width: float = 0.05,
+                     confidence: float = 0.95, batch: int = 100, max_samples: int = 10000, seed: int = 0,
+                     workers: int = None, periods: tuple = (10, 1000), **kwargs) -> Result:
+    """
+    Acceptance ratio of a scheduling test, partitioning or global procedure over random task sets
+
+    Per core count and utilization bucket, task sets are drawn in rounds of batch sets until the
+    Wilson interval of the ratio is narrower than width (or max_samples is reached). The sets of
+    all unconverged buckets of a round are analysed together (see batch_test/batch_partition).
+    Every round of a bucket uses its own random stream, seeded by (seed, core count, bucket, round),
+    so the result does not depend on the number of workers.
+
+    Buckets that cannot be sampled (total utilization above n, or so close to n that UUniFast-Discard
+    finds no valid set, see uunifast) are skipped: "sampled" is False and the ratio is NaN. A bucket
+    whose redraw limit is reached in a later round keeps the samples of the earlier rounds.
+
+    Parameters:
+
+        procedure: str          -> name of a TaskSet test (e.g. "tda_test") or Processor procedure (e.g. "rmffdu", "global_edf")
+        utilizations: list      -> utilization per core of the buckets (total utilization u * m)
+        core_counts: int | list -> number(s) of cores, 1 by default (ignored for TaskSet tests)
+        n: int                  -> number of tasks per set, 10 by default
+        width: float            -> target width of the confidence interval, 0.05 by default
+        confidence: float       -> confidence level, 0.95 by default
+        batch: int              -> task sets per bucket and round, 100 by default
+        max_samples: int        -> max. task sets per bucket, 10000 by default
+        seed: int               -> seed of the random streams, 0 by default
+        workers: int            -> number of worker processes, number of CPUs by default
+        periods: tuple          -> (min, max) period, (10, 1000) by default
+        kwargs: dict            -> further arguments of the test or procedure
+
+    Returns:
+
+        Result -> True if all sampled buckets converged; "ratio", "low", "high", "samples" and "sampled" as arrays
+                  (core counts x buckets)
+    """
+    if isinstance(core_counts, int):
+        core_counts = [core_counts]
+
+    test = hasattr(TaskSet, procedure)
+    if not test and not hasattr(Processor, procedure):
+        raise ValueError(f"Unknown test or procedure: {procedure}")
+
+    utilizations = numpy.asarray(utilizations, dtype=float)
+    shape = (len(core_counts), len(utilizations))
+
+    accepted = numpy.zeros(shape, dtype=numpy.int64)
+    samples = numpy.zeros(shape, dtype=numpy.int64)
+    low = numpy.zeros(shape)
+    high = numpy.ones(shape)
+    done = numpy.zeros(shape, dtype=bool)
+    sampled = numpy.ones(shape, dtype=bool)
+    rounds = 0
+
+    for c, m in enumerate(core_counts):
+        for b in range(shape[1]):
+            if utilizations[b] * (1 if test else m) > n:
+                sampled[c, b] = False
+                done[c, b] = True
+
+    while not done.all():
+        for c, m in enumerate(core_counts):
+            buckets = [b for b in range(shape[1]) if not done[c, b]]
+            if not buckets:
+                continue
+
+            sets = list()
+            for b in list(buckets):
+                rng = numpy.random.default_rng(numpy.random.SeedSequence([seed, m, b, int(samples[c, b])]))
+                U = utilizations[b] * (1 if test else m)
+                try:
+                    sets += [random_taskset(rng, n, U, periods) for _ in range(batch)]
+                except ValueError:
+                    # No valid set within the redraw limit: stop sampling the bucket (keeps earlier rounds)
+                    buckets.remove(b)
+                    sampled[c, b] = samples[c, b] > 0
+                    done[c, b] = True
+
+            if not buckets:
+                continue
+
+            with SharedTaskSets(sets) as shared:
+                if test:
+                    verdicts = batch_test(shared, procedure, workers, **kwargs)
+                else:
+                    verdicts = batch_partition(shared, procedure, m, workers, **kwargs)[0]
+
+            for k, b in enumerate(buckets):
+                accepted[c, b] += verdicts[k*batch:(k+1)*batch].sum()
+                samples[c, b] += batch
+                low[c, b], high[c, b] = wilson(int(accepted[c, b]), int(samples[c, b]), confidence)
+                done[c, b] = high[c, b] - low[c, b] < width or samples[c, b] >= max_samples
+
+        rounds += 1
+
+    ratio = numpy.full(shape, numpy.nan)
+    numpy.divide(accepted, samples, out=ratio, where=sampled)
+    low[~sampled], high[~sampled] = numpy.nan, numpy.nan
+
+    converged = bool((high - low < width)[sampled].all())
+    values = {
+        "u": utilizations,
+        "cores": list(core_counts),
+        "ratio": ratio,
+        "low": low,
+        "high": high,
+        "samples": samples,
+        "sampled": sampled,
+        "rounds": rounds
+    }
+
+    return Result(converged, values)
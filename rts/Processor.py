@@ -1,5 +1,14 @@
-import numpy
+import math
+from time import perf_counter
 
+from .Helpers import lazy_import, urm, urm_table
+from .Profiler import PROFILER, profiled
+from .Result import Result, PartitionResult
+from .Simulator import Simulator
+from .Task import PTask
+from .TaskSet import TaskSet, EPS
+
+numpy = lazy_import("numpy")
 
 class Processor:
     """
@@ -11,6 +20,7 @@ class Processor:
     """
     def __init__(self, core_count: int = 1):
         self.core_count = core_count
+        self.speeds = [1.0] * core_count
         self.prepare(self.core_count)
         
     def prepare(self, cc):
@@ -29,6 +39,10 @@ class Processor:
             self.core_dict[f"C{i+1}"]["u_max"] = 1
             self.core_dict[f"C{i+1}"]["u_rel"] = 0
             self.core_dict[f"C{i+1}"]["Tasks"] = list()
+
+        self.test = None
+        self.migrations = list()
+        self._probes = 0
             
     def reset(self):
         """
@@ -48,9 +62,38 @@ class Processor:
             if len(self.core_dict[f"C{i+1}"]["Tasks"]) != 0:
                 N += 1
         return N
+
+    def _result(self, success: bool, values: dict = None) -> PartitionResult:
+        """
+        Returns result of a partitioning procedure with current partitioning table
+        """
+        if PROFILER.enabled:
+            PROFILER.count("tasks.placed", sum(len(core["Tasks"]) for core in self.core_dict.values()))
+            self._count_probes()
+
+        return PartitionResult(success, self.core_dict, self.get_necessary_cores_count(), values)
+
+    def _assign(self, j: int, task, u_max: float):
+        """
+        Appends task to core j and updates its utilization entries (u_max: bound of the core with the task)
+        """
+        core = self.core_dict[f"C{j}"]
+        core["Tasks"].append(task)
+        core['u'] += task.u / self.speeds[j-1]
+        core["u_max"] = u_max
+        core["u_rel"] = core['u'] / u_max
+
+    def _count_probes(self):
+        """
+        Adds number of core probes (admission checks) since last call to PROFILER
+        """
+        if PROFILER.enabled:
+            PROFILER.count("core.probes", self._probes)
+        self._probes = 0
     
     # Partitioning procedures    
-    def rmnf(self, T) -> bool:
+    @profiled
+    def rmnf(self, T) -> PartitionResult:
         """
         Rate Monotonous Next Fit Scheduling using Liu-Layland-Test.
         
@@ -60,44 +103,37 @@ class Processor:
             
         Returns:
         
-            bool -> True if scheduling was successful
+            PartitionResult -> True if scheduling was successful, partitioning table
         """
         self.reset()
-        
-        i = 0  # Taskindex
-        j = 1  # Processorindex
+        self.test = "ll"
+
         T = T.sort('p')
         n = len(T)
         T = T.taskset
-        
+        table = urm_table(n)
+
+        i = 0  # Taskindex
+        j = 1  # Processorindex
+
         while i < n:
             if j > self.core_count:
-                return False
-            
-            t_urm = (len(self.core_dict[f"C{j}"]["Tasks"])+1) * (numpy.power(2, 1/(len(self.core_dict[f"C{j}"]["Tasks"])+1)) - 1) 
-            
-            
-            if self.core_dict[f"C{j}"]['u'] + (T[i].u) < t_urm:
-                self.core_dict[f"C{j}"]["Tasks"].append(T[i])
-                self.core_dict[f"C{j}"]['u'] += T[i].u
-                self.core_dict[f"C{j}"]["u_max"] = len(self.core_dict[f"C{j}"]["Tasks"]) * (numpy.power(2, 1/len(self.core_dict[f"C{j}"]["Tasks"])) - 1)
-                self.core_dict[f"C{j}"]["u_rel"] = self.core_dict[f"C{j}"]["u"] / self.core_dict[f"C{j}"]['u_max']
+                return self._result(False)
+
+            core = self.core_dict[f"C{j}"]
+            k = len(core["Tasks"]) + 1
+
+            self._probes += 1
+            if core['u'] + T[i].u / self.speeds[j-1] < table[k]:
+                self._assign(j, T[i], table[k])
+                i += 1
             else:
-                if j + 1 > self.core_count:
-                    return False
-                self.core_dict[f"C{j+1}"]["Tasks"].append(T[i])
-                self.core_dict[f"C{j+1}"]['u'] += T[i].u
-                self.core_dict[f"C{j+1}"]["u_max"] = len(self.core_dict[f"C{j}"]["Tasks"]) * (numpy.power(2, 1/len(self.core_dict[f"C{j}"]["Tasks"])) - 1)
-                self.core_dict[f"C{j}"]["u_rel"] = self.core_dict[f"C{j}"]["u"] / self.core_dict[f"C{j}"]['u_max']
                 j += 1
-                
-            i += 1
-            
-        print(f"Cores Necessary (N): {self.get_necessary_cores_count()}")
-            
-        return True
+
+        return self._result(True)
     
-    def rmff(self, T) -> bool:
+    @profiled
+    def rmff(self, T) -> PartitionResult:
         """
         Rate Monotonous First Fit Scheduling using Liu-Layland-Test.
         
@@ -107,42 +143,38 @@ class Processor:
             
         Returns:
         
-            bool -> True if scheduling was successful
+            PartitionResult -> True if scheduling was successful, partitioning table
         """
         self.reset()
-        
-        N = 1
-        i = 0
+        self.test = "ll"
+
         T = T.sort('p')
         n = len(T)
         T = T.taskset
-        
-        while i < n:
+        table = urm_table(n)
+        count = [0] * (self.core_count + 1)  # tasks per core
+        util = [0.0] * (self.core_count + 1)  # utilization per core
+        s = [1.0] + self.speeds               # speed per core
+
+        for task in T:
             j = 1
 
-            t_urm = (len(self.core_dict[f"C{j}"]["Tasks"])+1) * (numpy.power(2, 1/(len(self.core_dict[f"C{j}"]["Tasks"])+1)) - 1) 
-            
-            while self.core_dict[f"C{j}"]['u'] + (T[i].u) > t_urm:
+            self._probes += 1
+            while util[j] + task.u / s[j] > table[count[j] + 1]:
+                self._probes += 1
                 j += 1
-                
+
                 if j > self.core_count:
-                    return False 
-                
-            self.core_dict[f"C{j}"]["Tasks"].append(T[i])
-            self.core_dict[f"C{j}"]['u'] += T[i].u
-            self.core_dict[f"C{j}"]["u_max"] = len(self.core_dict[f"C{j}"]["Tasks"]) * (numpy.power(2, 1/len(self.core_dict[f"C{j}"]["Tasks"])) - 1)
-            self.core_dict[f"C{j}"]["u_rel"] = self.core_dict[f"C{j}"]["u"] / self.core_dict[f"C{j}"]['u_max']
-            
-            if j > N:
-                N = j
-            
-            i += 1
+                    return self._result(False)
 
-        print(f"Cores Necessary (N): {self.get_necessary_cores_count()}")
+            count[j] += 1
+            util[j] += task.u / s[j]
+            self._assign(j, task, table[count[j]])
 
-        return True
+        return self._result(True)
     
-    def rmffdu(self, T) -> bool:
+    @profiled
+    def rmffdu(self, T) -> PartitionResult:
         """
         Rate Monotonous First Fit with Decreasing Utilizations Scheduling using Hyperbolic Bound.
         
@@ -152,46 +184,38 @@ class Processor:
             
         Returns:
         
-            bool -> True if scheduling was successful
+            PartitionResult -> True if scheduling was successful, partitioning table
         """
         self.reset()
-        
-        i = 0  # Taskindex
-        N = 1  # Processor count
+        self.test = "hb"
+
         T = T.sort(key='u', desc=True)
         n = len(T)
         T = T.taskset
-        
-        while i < n:
+        table = urm_table(n)
+        count = [0] * (self.core_count + 1)  # tasks per core
+        hb = [1.0] * (self.core_count + 1)  # hyperbolic product per core
+        s = [1.0] + self.speeds             # speed per core
+
+        for task in T:
             j = 1  # Processorindex
-        
-            while True:
-                m_hb = 1
-                for task in self.core_dict[f"C{j}"]["Tasks"]:
-                    m_hb *= (task.u + 1)
-                
-                if T[i].u < 2/m_hb - 1:
-                    break
+
+            self._probes += 1
+            while task.u / s[j] >= 2/hb[j] - 1:
+                self._probes += 1
                 j += 1
-                
+
                 if j > self.core_count:
-                    return False
-                
-            self.core_dict[f"C{j}"]["Tasks"].append(T[i])
-            self.core_dict[f"C{j}"]['u'] += T[i].u
-            self.core_dict[f"C{j}"]["u_max"] = len(self.core_dict[f"C{j}"]["Tasks"]) * (numpy.power(2, 1/len(self.core_dict[f"C{j}"]["Tasks"])) - 1)
-            self.core_dict[f"C{j}"]["u_rel"] = self.core_dict[f"C{j}"]["u"] / self.core_dict[f"C{j}"]['u_max']
-            
-            if j > N:
-                N = j
-                
-            i += 1 
-        
-        print(f"Cores Necessary (N): {self.get_necessary_cores_count()}")
+                    return self._result(False)
 
-        return True
+            count[j] += 1
+            hb[j] *= task.u / s[j] + 1
+            self._assign(j, task, table[count[j]])
+
+        return self._result(True)
     
-    def rmst(self, T) -> bool:
+    @profiled
+    def rmst(self, T) -> PartitionResult:
         """
         Rate Monotonous Small Task Scheduling
         
@@ -201,9 +225,10 @@ class Processor:
             
         Returns:
         
-            bool -> True if scheduling was successful
+            PartitionResult -> True if scheduling was successful, partitioning table
         """
         self.reset()
+        self.test = "burchard"
         
         i = 0  # Taskindex
         j = 0  # Processorindex
@@ -216,10 +241,10 @@ class Processor:
             j += 1
             
             if j > self.core_count:
-                return False
+                return self._result(False)
             
             self.core_dict[f"C{j}"]["Tasks"].append(T[i])
-            self.core_dict[f"C{j}"]['u'] += T[i].u
+            self.core_dict[f"C{j}"]['u'] += T[i].u / self.speeds[j-1]
             tasks_planned += 1
             zeta = 0
             xmin = T[0].xi
@@ -231,47 +256,128 @@ class Processor:
                 if i >= n:
                     break
                 
+                self._probes += 1
                 zeta = T[i].xi - xmin
                 
-                if T[i].u + self.core_dict[f"C{j}"]['u'] <= numpy.max([numpy.log(2), 1 - zeta*numpy.log(2)]):
+                if T[i].u / self.speeds[j-1] + self.core_dict[f"C{j}"]['u'] <= max(math.log(2), 1 - zeta*math.log(2)):
                     self.core_dict[f"C{j}"]["Tasks"].append(T[i])
-                    self.core_dict[f"C{j}"]['u'] += T[i].u
-                    self.core_dict[f"C{j}"]["u_max"] = len(self.core_dict[f"C{j}"]["Tasks"]) * (numpy.power(2, 1/len(self.core_dict[f"C{j}"]["Tasks"])) - 1)
+                    self.core_dict[f"C{j}"]['u'] += T[i].u / self.speeds[j-1]
+                    self.core_dict[f"C{j}"]["u_max"] = urm(len(self.core_dict[f"C{j}"]["Tasks"]))
                     self.core_dict[f"C{j}"]["u_rel"] = self.core_dict[f"C{j}"]["u"] / self.core_dict[f"C{j}"]['u_max']
                     tasks_planned += 1
                     continue
 
                 ex = 1
         
-        print(f"Cores Necessary (N): {self.get_necessary_cores_count()}")
-
-        if tasks_planned != n:
-            return False
-        
-        return True
+        return self._result(tasks_planned == n)
     
-    def rmgt(self, T) -> bool:
+    @profiled
+    def rmgt(self, T) -> PartitionResult:
         """
         Rate Monotonous General Task Scheduling
         Using RMST for u <= 1/3
         Using RMFF for u > 1/3
-        
+
+        Both classes are packed onto disjoint cores of one array-backed core state: light tasks
+        by one sweep over xi (RMST), heavy tasks first fit by period (RMFF) on the remaining cores,
+        using a max tree over the spare capacity of the cores (O(n log n + m) in total).
+
         Parameters:
-        
+
             T: TaskSet -> task set that should be scheduled
-            
+
         Returns:
-        
-            bool -> True if scheduling was successful
+
+            PartitionResult -> True if scheduling was successful, partitioning table
         """
-        # TODO
         self.reset()
-        print(f"Cores Necessary (N): {self.get_necessary_cores_count()}")
-        return True
-    
-    def rmbf(self, T) -> bool:
+        self.test = "burchard"
+
+        m = self.core_count
+        tasks = list(T.taskset)
+        n = len(tasks)
+
+        U = numpy.array([task.u for task in tasks], dtype=float)
+        P = numpy.array([task.p for task in tasks], dtype=float)
+        XI = numpy.array([task.xi for task in tasks], dtype=float)
+
+        S = numpy.array(self.speeds, dtype=float)
+        core = numpy.full(n, -1)     # core index per task
+        cu = numpy.zeros(m)          # utilization per core
+        cn = numpy.zeros(m, int)     # task count per core
+
+        if PROFILER.enabled:
+            PROFILER.count("sort", 3)
+
+        light = numpy.flatnonzero(U <= 1/3)
+        heavy = numpy.flatnonzero(U > 1/3)
+
+        # RMST: sweep over light tasks ordered by xi
+        j = -1
+        xmin = 0
+        ln2 = numpy.log(2)
+
+        for i in light[numpy.argsort(XI[light], kind="stable")]:
+            self._probes += 1
+            if j < 0 or cu[j] + U[i] / S[j] > max(ln2, 1 - (XI[i] - xmin) * ln2):
+                j += 1
+                if j >= m:
+                    return self._result(False)
+                xmin = XI[i]
+
+            core[i] = j
+            cu[j] += U[i] / S[j]
+            cn[j] += 1
+
+        # RMFF: heavy tasks ordered by period, first fit on remaining cores. The spare capacity
+        # (bound for one more task - utilization) * speed of every core is kept in a max tree, so the
+        # first fitting core is found in O(log m)
+        first = j + 1
+        table = urm_table(n + 1)
+        cu, cn = cu.tolist(), cn.tolist()
+        size = 1 << max(0, m - 1).bit_length()
+        spare = [-math.inf] * (2 * size)
+
+        for j in range(first, m):
+            spare[size + j] = (table[cn[j] + 1] - cu[j]) * self.speeds[j]
+        for v in range(size - 1, 0, -1):
+            spare[v] = max(spare[2*v], spare[2*v + 1])
+
+        for i in heavy[numpy.argsort(P[heavy], kind="stable")].tolist():
+            self._probes += 1
+            u = tasks[i].u
+            if spare[1] < u:
+                return self._result(False)
+
+            v = 1
+            while v < size:
+                v = 2*v if spare[2*v] >= u else 2*v + 1
+
+            j = v - size
+            core[i] = j
+            cu[j] += u / self.speeds[j]
+            cn[j] += 1
+
+            spare[v] = (table[cn[j] + 1] - cu[j]) * self.speeds[j]
+            while v > 1:
+                v //= 2
+                spare[v] = max(spare[2*v], spare[2*v + 1])
+
+        for i in numpy.argsort(P, kind="stable"):
+            self.core_dict[f"C{core[i]+1}"]["Tasks"].append(tasks[i])
+
+        for j in range(m):
+            if cn[j]:
+                self.core_dict[f"C{j+1}"]['u'] = cu[j]
+                self.core_dict[f"C{j+1}"]["u_max"] = table[cn[j]]
+                self.core_dict[f"C{j+1}"]["u_rel"] = cu[j] / table[cn[j]]
+
+        return self._result(True)
+
+    @profiled
+    def rmbf(self, T) -> PartitionResult:
         """
-        Rate Monotonous Best Fit Scheduling
+        Rate Monotonous Best Fit Scheduling using Liu-Layland-Test.
         
         Parameters:
         
@@ -279,16 +385,20 @@ class Processor:
             
         Returns:
         
-            bool -> True if scheduling was successful
+            PartitionResult -> True if scheduling was successful, partitioning table
         """
-        # TODO
         self.reset()
-        print(f"Cores Necessary (N): {self.get_necessary_cores_count()}")
-        return True
+        self.test = "ll"
+
+        T = T.sort('p')
+        table = urm_table(len(T))
+
+        return self._fit(T.taskset, lambda k: table[k], best=True)
     
-    def rmwf(self, T) -> bool:
+    @profiled
+    def rmwf(self, T) -> PartitionResult:
         """
-        Rate Monotonous Worst Fit Scheduling
+        Rate Monotonous Worst Fit Scheduling using Liu-Layland-Test.
         
         Parameters:
         
@@ -296,14 +406,54 @@ class Processor:
             
         Returns:
         
-            bool -> True if scheduling was successful
+            PartitionResult -> True if scheduling was successful, partitioning table
         """
-        # TODO
         self.reset()
-        print(f"Cores Necessary (N): {self.get_necessary_cores_count()}")
-        return True
+        self.test = "ll"
+
+        T = T.sort('p')
+        table = urm_table(len(T))
+
+        return self._fit(T.taskset, lambda k: table[k], best=False)
+
+    def _fit(self, T, bound, best: bool) -> PartitionResult:
+        """
+        Places the tasks T (in the given order) on the feasible core with the least (best fit) or
+        most (worst fit) remaining utilization, ties go to the lowest core number
+
+        Parameters:
+
+            T: list         -> tasks in placement order
+            bound: function -> utilization bound of a core with k tasks
+            best: bool      -> best fit if True, worst fit otherwise
+        """
+        count = [0] * (self.core_count + 1)   # tasks per core
+        util = [0.0] * (self.core_count + 1)  # utilization per core
+        s = [1.0] + self.speeds               # speed per core
+
+        for task in T:
+            choice, spare = None, None
+
+            for j in range(1, self.core_count + 1):
+                self._probes += 1
+                rest = bound(count[j] + 1) - util[j] - task.u / s[j]
+
+                if rest < 0:
+                    continue
+                if choice is None or (rest < spare if best else rest > spare):
+                    choice, spare = j, rest
+
+            if choice is None:
+                return self._result(False)
+
+            count[choice] += 1
+            util[choice] += task.u / s[choice]
+            self._assign(choice, task, bound(count[choice]))
+
+        return self._result(True)
     
-    def edfnf(self, T) -> bool:
+    @profiled
+    def edfnf(self, T) -> PartitionResult:
         """
         Earliest Deadline First Next Fit Scheduling
         
@@ -313,40 +463,31 @@ class Processor:
             
         Returns:
         
-            bool -> True if scheduling was successful
+            PartitionResult -> True if scheduling was successful, partitioning table
         """
         self.reset()
-        
+        self.test = "u"
+
         i = 0  # Taskindex
         j = 1  # Processorindex
         n = len(T)
         T = T.taskset
-        
+
         while i < n:
             if j > self.core_count:
-                return False
-            
-            if self.core_dict[f"C{j}"]['u'] + (T[i].u) < 1:
-                self.core_dict[f"C{j}"]["Tasks"].append(T[i])
-                self.core_dict[f"C{j}"]['u'] += T[i].u
-                self.core_dict[f"C{j}"]["u_max"] = 1
-                self.core_dict[f"C{j}"]["u_rel"] = self.core_dict[f"C{j}"]["u"] / self.core_dict[f"C{j}"]['u_max']
+                return self._result(False)
+
+            self._probes += 1
+            if self.core_dict[f"C{j}"]['u'] + T[i].u / self.speeds[j-1] < 1:
+                self._assign(j, T[i], 1)
+                i += 1
             else:
-                if j + 1  > self.core_count:
-                    return False
-                self.core_dict[f"C{j+1}"]["Tasks"].append(T[i])
-                self.core_dict[f"C{j+1}"]['u'] += T[i].u
-                self.core_dict[f"C{j+1}"]["u_max"] = 1
-                self.core_dict[f"C{j}"]["u_rel"] = self.core_dict[f"C{j}"]["u"] / self.core_dict[f"C{j}"]['u_max']
                 j += 1
-            
-            i += 1
-            
-        print(f"Cores Necessary (N): {self.get_necessary_cores_count()}")
 
-        return True
+        return self._result(True)
     
-    def edfff(self, T) -> bool:
+    @profiled
+    def edfff(self, T) -> PartitionResult:
         """
         Earliest Deadline First First Fit Scheduling
         
@@ -356,39 +497,33 @@ class Processor:
             
         Returns:
         
-            bool -> True if scheduling was successful
+            PartitionResult -> True if scheduling was successful, partitioning table
         """
         self.reset()
+        self.test = "u"
 
-        N = 1
-        i = 0
-        n = len(T)
         T = T.taskset
+        util = [0.0] * (self.core_count + 1)  # utilization per core
+        s = [1.0] + self.speeds               # speed per core
 
-        while i < n:
+        for task in T:
             j = 1
 
-            while self.core_dict[f"C{j}"]['u'] + (T[i].u) > 1:
+            self._probes += 1
+            while util[j] + task.u / s[j] > 1:
+                self._probes += 1
                 j += 1
 
                 if j > self.core_count:
-                    return False
-
-            self.core_dict[f"C{j}"]["Tasks"].append(T[i])
-            self.core_dict[f"C{j}"]['u'] += T[i].u
-            self.core_dict[f"C{j}"]["u_max"] = len(self.core_dict[f"C{j}"]["Tasks"]) * (numpy.power(2, 1/len(self.core_dict[f"C{j}"]["Tasks"])) - 1)
-            self.core_dict[f"C{j}"]["u_rel"] = self.core_dict[f"C{j}"]["u"] / self.core_dict[f"C{j}"]['u_max']
+                    return self._result(False)
 
-            if j > N:
-                N = j
+            util[j] += task.u / s[j]
+            self._assign(j, task, 1)
 
-            i += 1
-
-        print(f"Cores Necessary (N): {self.get_necessary_cores_count()}")
-
-        return True
+        return self._result(True)
     
-    def edfbf(self, T) -> bool:
+    @profiled
+    def edfbf(self, T) -> PartitionResult:
         """
         Earliest Deadline First Best Fit Scheduling
         
@@ -398,15 +533,605 @@ class Processor:
             
         Returns:
         
-            bool -> True if scheduling was successful
+            PartitionResult -> True if scheduling was successful, partitioning table
+        """
+        self.reset()
+        self.test = "u"
+
+        return self._fit(T.taskset, lambda k: 1, best=True)
+
+    @profiled
+    def optimal(self, T, policy: str = "rm", test: str = None, time_budget: float = None) -> PartitionResult:
+        """
+        Optimal Partitioning (minimum number of cores) using Branch-and-Bound
+
+        Tasks are assigned by decreasing utilization, to an already used core (first fit order) or
+        to one new core (symmetry breaking: one unused core per speed, identical tasks only to cores
+        of ascending index). The search is pruned by the Martello-Toth bounds L1/L2 (identical cores,
+        capacity bound of the fastest cores otherwise) and the spare capacity of the used cores, and
+        warm started with RMFFDU (RM) or EDFFF (EDF) and first fit decreasing using the exact test.
+        Results of the per-core test are memoized per subset of tasks and core speed.
+
+        Parameters:
+
+            T: TaskSet          -> task set that should be scheduled
+            policy: str         -> "rm" or "edf", "rm" by default
+            test: str           -> per-core test (see _core_test), "rta" (RM) or "qpa" (EDF) by default
+            time_budget: float  -> max. search time in seconds, returns best partitioning found so far, None by default
+
+        Returns:
+
+            PartitionResult -> True if scheduling was successful, partitioning table
+        """
+        if test is None:
+            test = "rta" if policy == "rm" else "qpa"
+
+        tasks = sorted(T.taskset, key=lambda task: task.u, reverse=True)
+        n = len(tasks)
+        U = [task.u for task in tasks]
+
+        # Cores by decreasing speed (stable, identical cores keep their order)
+        m = self.core_count
+        order = sorted(range(m), key=lambda j: self.speeds[j], reverse=True)
+        S = [self.speeds[j] for j in order]
+
+        feasible = {s: dict() for s in S}
+        probes = [0]
+
+        def fits(mask, s):
+            probes[0] += 1
+            if mask not in feasible[s]:
+                feasible[s][mask] = self._core_test([tasks[i] for i in range(n) if mask >> i & 1], test, s)
+            return feasible[s][mask]
+
+        if not all(fits(1 << i, S[0]) for i in range(n)):
+            self.reset()
+            return self._result(False)
+
+        best = self._warm_start(T, tasks, policy, fits, order)
+        if S[0] == S[-1]:
+            lb = self._l2_bound([u / S[0] for u in U])
+        else:
+            lb = self._capacity_bound(sum(U), S)
+
+        suffix = [0.0] * (n + 1)
+        for i in range(n - 1, -1, -1):
+            suffix[i] = suffix[i+1] + U[i]
+
+        deadline = perf_counter() + time_budget if time_budget is not None else None
+        cores, loads, slots = list(), list(), list()
+        free = [True] * m
+        where = [0] * n
+        state = {"stop": len(best) <= lb, "timeout": False}
+
+        def search(i):
+            if deadline is not None and perf_counter() > deadline:
+                state["stop"] = state["timeout"] = True
+            if state["stop"]:
+                return
+
+            if i == n:
+                best[:] = [(slot, mask) for slot, mask in zip(slots, cores)]
+                state["stop"] = len(best) <= lb
+                return
+
+            spare = sum(S[slot] * (1 - load) for slot, load in zip(slots, loads))
+            rest = [S[k] for k in range(m) if free[k]]
+            if max(lb, len(cores) + self._capacity_bound(suffix[i] - spare, rest)) >= len(best):
+                return
+
+            bit = 1 << i
+            start = where[i-1] if i > 0 and self._identical(tasks[i], tasks[i-1]) else 0
+
+            for j in range(start, len(cores)):
+                u = U[i] / S[slots[j]]
+                if loads[j] + u <= 1 + EPS and fits(cores[j] | bit, S[slots[j]]):
+                    cores[j] |= bit
+                    loads[j] += u
+                    where[i] = j
+                    search(i + 1)
+                    cores[j] ^= bit
+                    loads[j] -= u
+
+            if len(cores) + 1 < len(best):
+                tried = set()
+                for k in range(m):
+                    if free[k] and S[k] not in tried and fits(bit, S[k]):
+                        tried.add(S[k])
+                        free[k] = False
+                        cores.append(bit)
+                        loads.append(U[i] / S[k])
+                        slots.append(k)
+                        where[i] = len(cores) - 1
+                        search(i + 1)
+                        free[k] = True
+                        cores.pop()
+                        loads.pop()
+                        slots.pop()
+
+        search(0)
+
+        if PROFILER.enabled:
+            PROFILER.count("sort")
+            PROFILER.count("core.probes", probes[0])
+            PROFILER.count("cache.misses", sum(len(cache) for cache in feasible.values()))
+            PROFILER.count("cache.hits", probes[0] - sum(len(cache) for cache in feasible.values()))
+
+        self.reset()
+        self.test = test
+
+        if len(best) > m:
+            return self._result(False)
+
+        for slot, mask in sorted(best):
+            core = sorted([tasks[i] for i in range(n) if mask >> i & 1], key=lambda task: task.p)
+            for task in core:
+                self._assign(order[slot] + 1, task, urm(len(core)) if policy == "rm" else 1)
+
+        return self._result(True, {"Optimality proven": not state["timeout"]})
+
+    def _warm_start(self, T, tasks, policy, fits, order) -> list:
+        """
+        Returns best initial partitioning (list of (slot, task mask), slots index cores by decreasing
+        speed as given by order) of the heuristic of the policy and first fit decreasing using the
+        per-core test fits, core_count + 1 placeholders if neither fits onto the cores
+        """
+        index = {id(task): i for i, task in enumerate(tasks)}
+        speeds = [self.speeds[j] for j in order]
+        candidates = [[None] * (self.core_count + 1)]
+
+        # The heuristic is part of this procedure, it is not profiled on its own (wrappers stay installed)
+        enabled = PROFILER.enabled
+        PROFILER.enabled = False
+        try:
+            heuristic = (self.rmffdu if policy == "rm" else self.edfff)(T)
+        finally:
+            PROFILER.enabled = enabled
+
+        if heuristic:
+            masks = list()
+            for slot, j in enumerate(order):
+                core = self.core_dict[f"C{j+1}"]
+                if core["Tasks"]:
+                    masks.append((slot, sum(1 << index[id(task)] for task in core["Tasks"])))
+            if all(fits(mask, speeds[slot]) for slot, mask in masks):
+                candidates.append(masks)
+
+        masks = [0] * self.core_count
+        for i in range(len(tasks)):
+            for slot in range(self.core_count):
+                if fits(masks[slot] | 1 << i, speeds[slot]):
+                    masks[slot] |= 1 << i
+                    break
+            else:
+                break
+        else:
+            candidates.append([(slot, mask) for slot, mask in enumerate(masks) if mask])
+
+        return min(candidates, key=len)
+
+    @staticmethod
+    def _capacity_bound(u: float, speeds) -> int:
+        """
+        Lower bound for the number of cores of the given speeds (decreasing) needed for total
+        utilization u (number of fastest cores whose total speed is at least u), len(speeds) + 1
+        if all cores are not enough
+        """
+        k, capacity = 0, 0.0
+        while capacity < u - EPS:
+            if k == len(speeds):
+                return k + 1
+            capacity += speeds[k]
+            k += 1
+
+        return k
+
+    @staticmethod
+    def _l2_bound(U) -> int:
+        """
+        Martello-Toth lower bound L2 (includes L1 = ceil(sum u)) for the number of cores
+
+        Parameters:
+
+            U: list -> utilizations of all tasks
         """
-        # TODO
+        L = math.ceil(sum(U) - EPS)
+
+        for a in [0] + [u for u in U if u <= 1/2]:
+            J1 = [u for u in U if u > 1 - a]
+            J2 = [u for u in U if 1/2 < u <= 1 - a]
+            J3 = [u for u in U if a <= u <= 1/2]
+            L = max(L, len(J1) + len(J2) + max(0, math.ceil(sum(J3) - (len(J2) - sum(J2)) - EPS)))
+
+        return L
+
+    @staticmethod
+    def _identical(t1, t2) -> bool:
+        return t1.p == t2.p and t1.e == t2.e and t1.d == t2.d
+
+    def _fits(self, j: int, tasks, test: str) -> bool:
+        """
+        Schedulability test for tasks on core j (at the speed of the core)
+        """
+        return self._core_test(tasks, test, self.speeds[j-1])
+
+    @staticmethod
+    def _core_test(tasks, test: str, speed: float = 1.0) -> bool:
+        """
+        Schedulability test for the tasks of one core
+
+        Parameters:
+
+            tasks: list     -> tasks of the core
+            test: str       -> "ll" (Liu-Layland), "hb" (Hyperbolic Bound), "burchard" (Burchard Test),
+                               "rta" (exact RM), "dm" (exact DM), "u" (EDF u <= 1) or "qpa" (exact EDF)
+            speed: float    -> speed of the core (execution times are divided by it), 1 by default
+
+        Returns:
+
+            bool -> True if tasks are schedulable on one core
+        """
+        if not tasks:
+            return True
+
+        if speed != 1:
+            tasks = [PTask(task.p, task.e / speed, task.fi, task.d) for task in tasks]
+
+        if test == "u":
+            return sum(task.u for task in tasks) <= 1
+        if test == "ll":
+            return sum(task.u for task in tasks) <= urm(len(tasks))
+        if test == "hb":
+            hb = 1
+            for task in tasks:
+                hb *= (task.u + 1)
+            return hb <= 2
+        if test == "burchard":
+            n = len(tasks)
+            u = sum(task.u for task in tasks)
+            if n == 1:
+                return u <= 1
+            zeta = max(task.xi for task in tasks) - min(task.xi for task in tasks)
+            return u <= (n - 1) * (2 ** (zeta/(n-1)) - 1) + 2 ** (1-zeta) - 1
+
+        T = TaskSet(*tasks)
+
+        if test == "rta":
+            return T._schedulable([task.e for task in tasks])[0]
+        if test == "dm":
+            return T._schedulable([task.e for task in tasks], key="d")[0]
+        if test == "qpa":
+            return bool(T.qpa_test())
+
+        raise ValueError(f"Unknown test: {test}")
+
+    # Semi-partitioned procedures
+    @profiled
+    def semi_partitioned(self, T, policy: str = "edf", tol: float = 1e-6) -> PartitionResult:
+        """
+        Semi-partitioned Scheduling with C=D Task Splitting
+
+        Tasks are placed by decreasing utilization using first fit and the exact per-core test.
+        A task that fits on no core is split: the core with the largest possible piece receives
+        a piece with C=D (body, runs immediately after release), the remaining execution time with
+        the remaining deadline is placed by first fit on another core or split again. Pieces of
+        a split task are released with the completion of the previous piece (phase fi).
+
+        Parameters:
+
+            T: TaskSet      -> task set that should be scheduled
+            policy: str     -> "edf" (QPA per core) or "rm" (exact RTA with deadline monotonic priorities per core), "edf" by default
+            tol: float      -> min. size of a piece relative to the execution time of the task, 1e-6 by default
+
+        Returns:
+
+            PartitionResult -> True if scheduling was successful, partitioning table, split tasks and number of pieces
+        """
+        if policy not in ("edf", "rm"):
+            raise ValueError(f"Unknown policy: {policy}")
+
         self.reset()
-        print(f"Cores Necessary (N): {self.get_necessary_cores_count()}")
+        self.test = "qpa" if policy == "edf" else "dm"
+
+        split = list()
+        pieces = 0
+
+        for task in sorted(T.taskset, key=lambda task: task.u, reverse=True):
+            j = self._first_fit(task, self.test)
+
+            if j is not None:
+                self._add(j, task)
+                continue
+
+            e, d, fi = task.e, task.d, task.fi
+            used = list()
+
+            while True:
+                # Body: largest C=D piece over all cores not holding a piece of the task yet
+                best, best_e = None, 0
+                for j in range(1, self.core_count + 1):
+                    if j in used:
+                        continue
+                    body = self._max_piece(j, task.p, e, fi, tol * task.e)
+                    if body > best_e:
+                        best, best_e = j, body
+
+                if best is None:
+                    return self._result(False, {"Split tasks": split, "Pieces": pieces})
+
+                self._add(best, PTask(task.p, best_e, fi, best_e))
+                used.append(best)
+                pieces += 1
+                e, d, fi = e - best_e, d - best_e, fi + best_e
+
+                # Tail: remaining execution time with remaining deadline
+                tail = PTask(task.p, e, fi, d)
+                j = self._first_fit(tail, self.test, used)
+
+                if j is not None:
+                    self._add(j, tail)
+                    pieces += 1
+                    split.append(task)
+                    break
+
+        return self._result(True, {"Split tasks": split, "Pieces": pieces})
+
+    def _first_fit(self, task, test: str, exclude: list = ()) -> int:
+        """
+        Returns number of the first core task fits on (cores in exclude are skipped), None if it fits on no core
+        """
+        for j in range(1, self.core_count + 1):
+            if j in exclude:
+                continue
+            self._probes += 1
+            if self._fits(j, self.core_dict[f"C{j}"]["Tasks"] + [task], test):
+                return j
+        return None
+
+    def _max_piece(self, j: int, p: float, e: float, fi: float, tol: float) -> float:
+        """
+        Largest execution time c < e of a piece with C=D (period p, phase fi) that fits on core j
+        (bisection), 0 if no piece of at least tol fits
+        """
+        tasks = self.core_dict[f"C{j}"]["Tasks"]
+        spare = 1 - self.core_dict[f"C{j}"]['u']
+
+        lo, hi = 0.0, min(e - tol, spare * p * self.speeds[j-1])
+        if hi < tol:
+            return 0.0
+
+        self._probes += 1
+        if self._fits(j, tasks + [PTask(p, hi, fi, hi)], self.test):
+            return hi
+
+        while hi - lo > tol:
+            mid = (lo + hi) / 2
+            self._probes += 1
+            if self._fits(j, tasks + [PTask(p, mid, fi, mid)], self.test):
+                lo = mid
+            else:
+                hi = mid
+
+        return lo if lo >= tol else 0.0
+
+    # Incremental partitioning
+    @profiled
+    def place_task(self, task, test: str = None, max_migrations: int = 1) -> bool:
+        """
+        Adds a task to the current partitioning (first fit). If it fits on no core, up to
+        max_migrations tasks already placed are moved to other cores to make room.
+
+        Parameters:
+
+            task: PTask         -> task to add
+            test: str           -> per-core test (see _core_test), test of last partitioning procedure by default
+            max_migrations: int -> max. number of moved tasks, 1 by default
+
+        Returns:
+
+            bool -> True if task was placed (moved tasks in self.migrations as (task, from, to))
+        """
+        test = self._incremental_test(test)
+        self.migrations = list()
+
+        placed = self._insert(task, test, max_migrations, None, [task])
+        self._count_probes()
+
+        return placed
+
+    @profiled
+    def remove_task(self, task) -> bool:
+        """
+        Removes a task from the current partitioning. No other task is moved.
+
+        Parameters:
+
+            task: PTask -> task to remove
+
+        Returns:
+
+            bool -> True if task was part of the partitioning
+        """
+        self.migrations = list()
+        j = self._find_task(task)
+
+        if j is None:
+            return False
+
+        self._remove(j, self.core_dict[f"C{j}"]["Tasks"][self._task_index(j, task)])
+
         return True
 
+    @profiled
+    def update_task(self, task, e: float, test: str = None, max_migrations: int = 1) -> bool:
+        """
+        Changes the execution time of a task of the current partitioning. Only the core of the task
+        is rechecked. If it no longer fits, the task or up to max_migrations tasks are moved.
+
+        Parameters:
+
+            task: PTask         -> task to change
+            e: float            -> new execution time
+            test: str           -> per-core test (see _core_test), test of last partitioning procedure by default
+            max_migrations: int -> max. number of moved tasks, 1 by default
+
+        Returns:
+
+            bool -> True if the partitioning with the changed task is schedulable (unchanged otherwise)
+        """
+        test = self._incremental_test(test)
+        self.migrations = list()
+        j = self._find_task(task)
+
+        if j is None:
+            return False
+
+        old = self.core_dict[f"C{j}"]["Tasks"][self._task_index(j, task)]
+        new = PTask(old.p, e, old.fi, old.d)
+
+        self._remove(j, old)
+        self._probes += 1
+
+        if self._fits(j, self.core_dict[f"C{j}"]["Tasks"] + [new], test):
+            self._add(j, new)
+            placed = True
+        else:
+            # Keep the task on its core and move co-located tasks first, move the task itself otherwise
+            placed = self._evict(j, new, test, max_migrations, None, [new]) or \
+                self._insert(new, test, max_migrations, j, [new])
+
+        if not placed:
+            self._add(j, old)
+
+        self._count_probes()
+
+        return placed
+
+    def _incremental_test(self, test: str) -> str:
+        """
+        Returns per-core test for incremental operations (exact RTA if no procedure was run),
+        an empty processor adopts the test
+        """
+        if test is None:
+            test = self.test if self.test is not None else "rta"
+        if self.test is None:
+            self.test = test
+        return test
+
+    def _insert(self, task, test: str, budget: int, origin, moved) -> bool:
+        """
+        Places task on a core other than origin (first fit), evicting and reinserting tasks
+        of other cores as long as the migration budget allows it
+
+        Parameters:
+
+            task: PTask     -> task to place
+            test: str       -> per-core test
+            budget: int     -> remaining migrations
+            origin: int     -> core the task is moved from, None for new tasks
+            moved: list     -> tasks that must not be moved (again)
+        """
+        cost = 0 if origin is None else 1
+
+        if budget >= cost:
+            for j in range(1, self.core_count + 1):
+                self._probes += 1
+                if j != origin and self._fits(j, self.core_dict[f"C{j}"]["Tasks"] + [task], test):
+                    self._add(j, task)
+                    if origin is not None:
+                        self.migrations.append((task, f"C{origin}", f"C{j}"))
+                    return True
+
+        if budget < cost + 1:
+            return False
+
+        for j in range(1, self.core_count + 1):
+            if j != origin and self._evict(j, task, test, budget - cost, origin, moved):
+                return True
+
+        return False
+
+    def _evict(self, j: int, task, test: str, budget: int, origin, moved) -> bool:
+        """
+        Places task on core j by moving one of its tasks (largest utilization first) to another
+        core, as long as the migration budget allows it (see _insert)
+
+        Parameters:
+
+            j: int          -> core the task should be placed on
+            task: PTask     -> task to place
+            test: str       -> per-core test
+            budget: int     -> remaining migrations (for the evicted task)
+            origin: int     -> core the task is moved from, None for new tasks or tasks staying on j
+            moved: list     -> tasks that must not be moved (again)
+        """
+        tasks = self.core_dict[f"C{j}"]["Tasks"]
+
+        for victim in sorted(tasks, key=lambda t: t.u, reverse=True):
+            if any(victim is t for t in moved):
+                continue
+
+            rest = [t for t in tasks if t is not victim]
+            self._probes += 1
+            if not self._fits(j, rest + [task], test):
+                continue
+
+            self._remove(j, victim)
+            self._add(j, task)
+            if origin is not None:
+                self.migrations.append((task, f"C{origin}", f"C{j}"))
+
+            if self._insert(victim, test, budget, j, moved + [victim]):
+                return True
+
+            if origin is not None:
+                self.migrations.pop()
+            self._remove(j, task)
+            self._add(j, victim)
+
+        return False
+
+    def _find_task(self, task):
+        """
+        Returns number of the core holding task (identical object first, equal task otherwise), None if not found
+        """
+        for match in (lambda t: t is task, lambda t: t == task):
+            for j in range(1, self.core_count + 1):
+                if any(match(t) for t in self.core_dict[f"C{j}"]["Tasks"]):
+                    return j
+        return None
+
+    def _task_index(self, j: int, task) -> int:
+        tasks = self.core_dict[f"C{j}"]["Tasks"]
+        for i, t in enumerate(tasks):
+            if t is task:
+                return i
+        return tasks.index(task)
+
+    def _add(self, j: int, task):
+        tasks = self.core_dict[f"C{j}"]["Tasks"]
+        tasks.append(task)
+        tasks.sort(key=lambda t: t.p)
+        self._update_core(j)
+
+    def _remove(self, j: int, task):
+        tasks = self.core_dict[f"C{j}"]["Tasks"]
+        del tasks[next(i for i, t in enumerate(tasks) if t is task)]
+        self._update_core(j)
+
+    def _update_core(self, j: int):
+        """
+        Recomputes utilization entries of core j after its tasks changed
+        """
+        core = self.core_dict[f"C{j}"]
+        n = len(core["Tasks"])
+        core['u'] = sum(task.u for task in core["Tasks"]) / self.speeds[j-1]
+        core["u_max"] = 1 if n == 0 or self.test in ("u", "qpa") else urm(n)
+        core["u_rel"] = core['u'] / core["u_max"]
+
     # Global procedures
-    def adaptive_tkc(self, T) -> bool:
+    @profiled
+    def adaptive_tkc(self, T) -> Result:
         """
         Adaptive TkC
         
@@ -416,27 +1141,23 @@ class Processor:
             
         Returns:
         
-            bool -> True if scheduling was successful
+            Result -> True if scheduling was successful, bound values
         """
         self.reset()
         
         m = self.core_count
         
-        for task in T.taskset:
-            task.pke = task.p - (m-1*numpy.sqrt(5*m**2-6*m+1)/(2*m)) * task.e
-            
-        T = T.sort('pke')
-        
-        Us = ((2*m)/(3*m-1+numpy.sqrt(5*m**2-6*m+1)))
+        k = m-1*math.sqrt(5*m**2-6*m+1)/(2*m)
+
+        # order by pke = p - k*e, kept off the tasks
+        T = TaskSet(*sorted(T.taskset, key=lambda task: task.p - k * task.e))
         
-        print(f"Task set ordered by k = {T}")
-        print(f"Us = {Us}")
+        Us = ((2*m)/(3*m-1+math.sqrt(5*m**2-6*m+1)))
         
-        print(f"Cores Necessary (N): {self.get_necessary_cores_count()}")
-
-        return T.u < Us
+        return Result(T.u < Us, {"Task set ordered by k": T, "Us": Us, "u": T.u})
     
-    def rmus(self, T) -> bool:
+    @profiled
+    def rmus(self, T) -> Result:
         """
         Rate Monotonic Utilization Separation
         
@@ -446,34 +1167,31 @@ class Processor:
             
         Returns:
         
-            bool -> True if scheduling was successful
+            Result -> True if scheduling was successful, bound values
         """
         self.reset()
         
         m = self.core_count
-        umax = numpy.power(m, 2)/(3*m - 2)
+        umax = m ** 2/(3*m - 2)
         us = m/(3*m-2)
 
-        print(f"Separation Value = {us}")
-        
         T = T.sort('p')
         
-        print(f"Task set ordered by p: {T}")
-        
         high_prio = [task for task in T.taskset if task.u > us]
         low_prio = [task for task in T.taskset if task.u <= us]
-        
-        print(f"High Priority Tasks: {high_prio}")
-        print(f"Low Priority Tasks: {low_prio}")
 
-        print(f"Max. schedulable utilization = {umax}")
-        print(f"Task set utilization = {T.u}")
-        
-        print(f"Cores Necessary (N): {self.get_necessary_cores_count()}")
+        values = {
+            "Separation Value": us,
+            "High Priority Tasks": high_prio,
+            "Low Priority Tasks": low_prio,
+            "Max. schedulable utilization": umax,
+            "Task set utilization": T.u
+        }
 
-        return T.u < umax
+        return Result(T.u < umax, values)
     
-    def global_edf(self, T) -> bool:
+    @profiled
+    def global_edf(self, T) -> Result:
         """
         Global Earliest Deadline First
         
@@ -483,7 +1201,7 @@ class Processor:
             
         Returns:
         
-            bool -> True if scheduling was successful
+            Result -> True if scheduling was successful, bound values
         """
         self.reset()
         
@@ -494,13 +1212,10 @@ class Processor:
 
         u = umax + m * (1 - umax)
         
-        print(f"u = {u}, Tu = {T.u}")
-        
-        print(f"Cores Necessary (N): {self.get_necessary_cores_count()}")
-
-        return T.u < u
+        return Result(T.u < u, {"u": u, "Tu": T.u})
     
-    def edfus(self, T) -> bool:
+    @profiled
+    def edfus(self, T) -> Result:
         """
         Earliest Deadline First Utilization Separation
         
@@ -510,7 +1225,7 @@ class Processor:
             
         Returns:
         
-            bool -> True if scheduling was successful
+            Result -> True if scheduling was successful, bound values
         """
         self.reset()
 
@@ -523,14 +1238,12 @@ class Processor:
         high_prio = [task for task in T.taskset if task.u > us]
         low_prio = [task for task in T.taskset if task.u <= us]
         
-        print(f"High Priority Tasks: {high_prio}")
-        print(f"Low Priority Tasks: {low_prio}")
-        
-        print(f"Cores Necessary (N): {self.get_necessary_cores_count()}")
+        values = {"High Priority Tasks": high_prio, "Low Priority Tasks": low_prio, "umax": umax, "u": T.u}
 
-        return T.u < umax
+        return Result(T.u < umax, values)
     
-    def fpedf(self, T) -> bool:
+    @profiled
+    def fpedf(self, T) -> Result:
         """
         First Priority Earliest Deadline First
         
@@ -540,7 +1253,7 @@ class Processor:
             
         Returns:
         
-            bool -> True if scheduling was successful
+            Result -> True if scheduling was successful, bound values
         """
         self.reset()
         
@@ -553,9 +1266,130 @@ class Processor:
         high_prio = [task for task in T.taskset if task.u > 0.5]
         low_prio = [task for task in T.taskset if task.u <= 0.5]
 
-        print(f"High Priority Tasks: {high_prio}")
-        print(f"Low Priority Tasks: {low_prio}")
-        
-        print(f"Cores Necessary (N): {self.get_necessary_cores_count()}")
+        values = {"High Priority Tasks": high_prio, "Low Priority Tasks": low_prio, "umax": umax, "u": T.u}
+
+        return Result(alpha <= 0.5 and T.u <= umax, values)
+
+    def simulate(self, T, policy: str = "gedf", max_hyperperiods: int = 10, stop_on_miss: bool = False):
+        """
+        Simulates global scheduling of the task set on the cores of this processor (see Simulator.run)
+
+        Parameters:
+
+            T: TaskSet              -> task set that should be scheduled
+            policy: str             -> "gedf", "grm", "fpedf", "edfus" or "rmus", "gedf" by default
+            max_hyperperiods: int   -> max. number of simulated hyperperiods, 10 by default
+            stop_on_miss: bool      -> stop at first deadline miss, False by default
+
+        Returns:
+
+            SimulationResult -> True if no deadline was missed, misses, migrations and preemptions
+        """
+        return Simulator(self.core_count).run(T, policy, max_hyperperiods, stop_on_miss)
+
+    # Sensitivity analysis
+    def _scaled(self, T, scale: float = 1.0, k: int = None, de: float = 0.0):
+        """
+        Returns copy of task set T with all execution times multiplied by scale and
+        execution time of task k increased by de
+        """
+        tasks = list()
+        for i, task in enumerate(T.taskset):
+            e = task.e * scale + (de if i == k else 0)
+            tasks.append(PTask(task.p, e, task.fi, task.d))
+        return TaskSet(*tasks)
+
+    @profiled
+    def critical_scaling_factor(self, T, procedure: str = "rmffdu", tol: float = 1e-6) -> float:
+        """
+        Critical scaling factor of a partitioning procedure (largest factor all execution times can
+        be multiplied with while the procedure still succeeds on this processor), computed by bisection.
+
+        The search is bracketed by the capacity of the processor (total utilization <= sum of the
+        core speeds, every task utilization <= speed of the fastest core). After the call the partitioning table holds the partitioning
+        for the returned factor.
+
+        Note: partitioning heuristics are not monotone in the execution times, the result is the
+        boundary found by bisection.
+
+        Parameters:
+
+            T: TaskSet      -> task set that should be scheduled
+            procedure: str  -> name of partitioning procedure (e.g. "rmff"), "rmffdu" by default
+            tol: float      -> relative tolerance of the result, 1e-6 by default
+
+        Returns:
+
+            float -> critical scaling factor (0 if the procedure fails for every factor)
+        """
+        partition = getattr(self, procedure)
+
+        hi = min(sum(self.speeds) / T.u, max(self.speeds) / max(task.u for task in T.taskset))
+        lo = 0
+
+        if partition(self._scaled(T, hi)):
+            return hi
+
+        while hi - lo > tol * hi:
+            mid = (lo + hi) / 2
+
+            if partition(self._scaled(T, mid)):
+                lo = mid
+            else:
+                hi = mid
+
+        if lo > 0:
+            partition(self._scaled(T, lo))
+        else:
+            self.reset()
+
+        return lo
+
+    @profiled
+    def max_e_growth(self, T, procedure: str = "rmffdu", tol: float = 1e-6) -> list:
+        """
+        Maximum growth of the execution time per task (all other tasks unchanged) for which
+        a partitioning procedure still succeeds on this processor, computed by bisection.
+
+        Every bisection is bracketed by the task's own limit (e <= min(p, d) on the fastest core)
+        and the spare capacity of the processor.
+
+        Parameters:
+
+            T: TaskSet      -> task set that should be scheduled
+            procedure: str  -> name of partitioning procedure (e.g. "rmff"), "rmffdu" by default
+            tol: float      -> tolerance relative to the deadline of each task, 1e-6 by default
+
+        Returns:
+
+            list -> allowed growth of e per task (order of T.taskset), 0 if procedure fails
+        """
+        partition = getattr(self, procedure)
+
+        if not partition(self._scaled(T)):
+            return [0.0] * len(T)
+
+        spare = sum(self.speeds) - T.u
+        growth = list()
+
+        for k, task in enumerate(T.taskset):
+            lo = 0
+            hi = min(min(task.p, task.d) * max(self.speeds) - task.e, spare * task.p)
+
+            if partition(self._scaled(T, k=k, de=hi)):
+                growth.append(hi)
+                continue
+
+            while hi - lo > tol * task.d:
+                mid = (lo + hi) / 2
+
+                if partition(self._scaled(T, k=k, de=mid)):
+                    lo = mid
+                else:
+                    hi = mid
+
+            growth.append(lo)
+
+        partition(self._scaled(T))
 
-        return alpha <= 0.5 and T.u <= umax
\ No newline at end of file
+        return growth
@@ -0,0 +1,171 @@
+import json
+import marshal
+import sys
+from functools import wraps
+from time import perf_counter
+
+
+class Profiler:
+    """
+    Opt-in instrumentation of TaskSet and Processor
+
+    Counters (e.g. "rta.iterations", "core.probes", "cache.hits", "sort") and wall time per
+    procedure are only recorded while the profiler is enabled. The timing wrappers of the
+    profiled procedures are installed by enable and removed by disable, so disabled calls run
+    the plain functions (methods bound before enable are not timed).
+
+    Usage:
+
+        with PROFILER:
+            ...
+        PROFILER.to_json("profile.json")
+        PROFILER.dump_stats("profile.prof")  # pstats.Stats("profile.prof")
+    """
+    def __init__(self):
+        self.enabled = False
+        self.reset()
+
+    def reset(self):
+        """
+        Clears all counters and timers
+        """
+        self.counters = dict()
+        self.timers = dict()  # name -> [calls, total time]
+        self.where = dict()   # name -> (file, line)
+
+    def enable(self):
+        if not self.enabled:
+            for f in _PROFILED:
+                setattr(_owner(f), f.__name__, _timed(f))
+        self.enabled = True
+
+    def disable(self):
+        if self.enabled:
+            for f in _PROFILED:
+                setattr(_owner(f), f.__name__, f)
+        self.enabled = False
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc):
+        self.disable()
+
+    def count(self, name: str, k: int = 1):
+        """
+        Increments counter name by k
+        """
+        self.counters[name] = self.counters.get(name, 0) + k
+
+    def add_time(self, name: str, dt: float, where: tuple = None):
+        """
+        Adds one call of procedure name taking dt seconds
+        """
+        timer = self.timers.setdefault(name, [0, 0.0])
+        timer[0] += 1
+        timer[1] += dt
+        if where is not None:
+            self.where[name] = where
+
+    def to_dict(self) -> dict:
+        """
+        Returns counters and timers as dict (e.g. to send it from a worker process)
+        """
+        return {
+            "counters": dict(self.counters),
+            "timers": {name: {"calls": c, "time": t} for name, (c, t) in self.timers.items()},
+            "where": {name: list(w) for name, w in self.where.items()}
+        }
+
+    def merge(self, other):
+        """
+        Adds counters and timers of another Profiler (or its to_dict()), e.g. of a batch run
+
+        Parameters:
+
+            other: Profiler | dict -> profile to add
+        """
+        if isinstance(other, Profiler):
+            other = other.to_dict()
+
+        for name, k in other["counters"].items():
+            self.count(name, k)
+
+        for name, timer in other["timers"].items():
+            t = self.timers.setdefault(name, [0, 0.0])
+            t[0] += timer["calls"]
+            t[1] += timer["time"]
+
+        for name, w in other.get("where", dict()).items():
+            self.where[name] = tuple(w)
+
+    def to_json(self, path: str = None) -> str:
+        """
+        Returns profile as JSON, also written to path if given
+        """
+        s = json.dumps(self.to_dict(), indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(s)
+        return s
+
+    def dump_stats(self, path: str):
+        """
+        Writes timers in the format of pstats (load with pstats.Stats(path)).
+        Time of nested procedures is included in the time of the calling procedure.
+        """
+        stats = dict()
+        for name, (calls, total) in self.timers.items():
+            file, line = self.where.get(name, ("~", 0))
+            stats[(file, line, name)] = (calls, calls, total, total, dict())
+
+        with open(path, "wb") as f:
+            marshal.dump(stats, f)
+
+
+PROFILER = Profiler()
+
+
+# Functions marked by profiled (timed while PROFILER is enabled)
+_PROFILED = list()
+
+
+def profiled(f):
+    """
+    Decorator marking method f to record wall time of every call while PROFILER is enabled
+    (f itself is returned, the timing wrapper is installed by PROFILER.enable)
+    """
+    _PROFILED.append(f)
+    return f
+
+
+def _owner(f):
+    """
+    Returns class of method f (by its qualified name)
+    """
+    owner = sys.modules[f.__module__]
+    for part in f.__qualname__.split(".")[:-1]:
+        owner = getattr(owner, part)
+    return owner
+
+
+def _timed(f):
+    """
+    Returns wrapper of f adding the wall time of every call to PROFILER (while enabled)
+    """
+    name = f.__qualname__
+    where = (f.__code__.co_filename, f.__code__.co_firstlineno)
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        if not PROFILER.enabled:
+            return f(*args, **kwargs)
+
+        t = perf_counter()
+        try:
+            return f(*args, **kwargs)
+        finally:
+            PROFILER.add_time(name, perf_counter() - t, where)
+
+    return wrapper
@@ -0,0 +1,122 @@
+class Result:
+    """
+    Result of a scheduling test or procedure
+
+    Parameters:
+
+        success: bool   -> verdict of the test or procedure
+        values: dict    -> bound values and intermediate results, e.g. {"u": 0.7, "urm": 0.78}
+        trace: list     -> per-iteration values (only if requested), None by default
+
+    Printing (str) and to_frame() are only evaluated on request, the analysis itself does no I/O.
+    """
+    __slots__ = ("success", "values", "trace")
+
+    def __init__(self, success: bool, values: dict = None, trace: list = None):
+        self.success = bool(success)
+        self.values = values if values is not None else dict()
+        self.trace = trace
+
+    def __bool__(self) -> bool:
+        return self.success
+
+    def __getitem__(self, key):
+        return self.values[key]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.success})"
+
+    def __str__(self) -> str:
+        lines = [f"{key}\t= {self._fmt(value)}" for key, value in self.values.items()]
+
+        if self.trace is not None:
+            lines += [f"t{k}\t= {self._fmt(t)}" for k, t in enumerate(self.trace)]
+
+        lines.append(f"=> {self.success}")
+
+        return "\n".join(lines)
+
+    @staticmethod
+    def _fmt(value):
+        if isinstance(value, float):
+            return round(value, 4)
+        return value
+
+    def to_frame(self):
+        """
+        Returns values as pandas.DataFrame (one row per value)
+        """
+        import pandas
+        return pandas.DataFrame({"value": list(self.values.values())}, index=list(self.values.keys()))
+
+
+class PartitionResult(Result):
+    """
+    Result of a partitioning procedure
+
+    Parameters:
+
+        success: bool   -> verdict of the procedure
+        partition: dict -> partitioning table of the Processor
+        cores: int      -> number of cores used
+        values: dict    -> further values, None by default
+    """
+    __slots__ = ("partition", "cores")
+
+    def __init__(self, success: bool, partition: dict, cores: int, values: dict = None):
+        super().__init__(success, values)
+        self.partition = partition
+        self.cores = cores
+
+    def __str__(self) -> str:
+        lines = [f"Cores Necessary (N): {self.cores}"]
+        lines += [f"{key}: {self._fmt(value)}" for key, value in self.values.items()]
+        lines.append(f"=> {self.success}")
+
+        return "\n".join(lines)
+
+    def to_frame(self):
+        """
+        Returns partitioning table as pandas.DataFrame (one row per core)
+        """
+        import pandas
+        return pandas.DataFrame(self.partition).T
+
+
+class SimulationResult(Result):
+    """
+    Result of a simulation
+
+    Parameters:
+
+        success: bool       -> True if no deadline was missed
+        misses: int         -> number of jobs that missed their deadline
+        migrations: int     -> number of jobs resumed on another core
+        preemptions: int    -> number of jobs removed from a core before completion
+        time: float         -> simulated time
+        steady: bool        -> True if a steady state was detected (schedule repeats from there on)
+        values: dict        -> further values, None by default
+    """
+    __slots__ = ("misses", "migrations", "preemptions", "time", "steady")
+
+    def __init__(self, success: bool, misses: int, migrations: int, preemptions: int, time: float,
+                 steady: bool, values: dict = None):
+        super().__init__(success, values)
+        self.misses = misses
+        self.migrations = migrations
+        self.preemptions = preemptions
+        self.time = time
+        self.steady = steady
+
+    def __str__(self) -> str:
+        lines = [
+            f"Deadline misses: {self.misses}",
+            f"Migrations: {self.migrations}",
+            f"Preemptions: {self.preemptions}",
+            f"Simulated time: {self._fmt(self.time)} (steady state: {self.steady})"
+        ]
+        lines += [f"{key}: {self._fmt(value)}" for key, value in self.values.items()]
+        lines.append(f"=> {self.success}")
+
+        return "\n".join(lines)
+
@@ -0,0 +1,189 @@
+import heapq
+
+from .Helpers import integer_scale, lcm
+from .Profiler import PROFILER, profiled
+from .Result import SimulationResult
+
+
+class Simulator:
+    """
+    Event-driven simulation of global scheduling on identical cores
+
+    Policies:
+
+        gedf:   Global EDF
+        grm:    Global RM
+        fpedf:  fpEDF (up to m-1 tasks with u > 1/2 highest priority, others EDF)
+        edfus:  EDF Utilization Separation (u > m/(2m-1) highest priority, others EDF)
+        rmus:   RM Utilization Separation (u > m/(3m-2) highest priority, others RM)
+
+    Parameters:
+
+        core_count: int -> number of cores (1 by default)
+    """
+    POLICIES = ("gedf", "grm", "fpedf", "edfus", "rmus")
+
+    def __init__(self, core_count: int = 1):
+        self.core_count = core_count
+
+    def _classes(self, T, policy: str) -> list:
+        """
+        Returns priority class per task (0: highest priority, 1: by policy)
+        """
+        m = self.core_count
+        U = [task.u for task in T.taskset]
+
+        if policy == "fpedf":
+            heavy = sorted((i for i in range(len(U)) if U[i] > 1/2), key=lambda i: U[i], reverse=True)[:m-1]
+            return [0 if i in heavy else 1 for i in range(len(U))]
+        if policy == "edfus":
+            return [0 if u > m/(2*m-1) else 1 for u in U]
+        if policy == "rmus":
+            return [0 if u > m/(3*m-2) else 1 for u in U]
+        if policy in ("gedf", "grm"):
+            return [1] * len(U)
+
+        raise ValueError(f"Unknown policy: {policy}")
+
+    @profiled
+    def run(self, T, policy: str = "gedf", max_hyperperiods: int = 10, stop_on_miss: bool = False) -> SimulationResult:
+        """
+        Simulates the task set until the system state at two consecutive hyperperiod boundaries
+        (after the largest phase) is equal, at most max_hyperperiods hyperperiods.
+
+        The ready queue is a heap, a dispatched job keeps its previous core if that core is free.
+        All times are converted to integers before the simulation.
+
+        Parameters:
+
+            T: TaskSet              -> task set that should be scheduled
+            policy: str             -> scheduling policy (see Simulator.POLICIES), "gedf" by default
+            max_hyperperiods: int   -> max. number of simulated hyperperiods, 10 by default
+            stop_on_miss: bool      -> stop at first deadline miss, False by default
+
+        Returns:
+
+            SimulationResult -> True if no deadline was missed, misses, migrations and preemptions
+        """
+        tasks = T.taskset
+        n = len(tasks)
+        m = self.core_count
+
+        times, scale = integer_scale([v for task in tasks for v in (task.p, task.e, task.d, task.fi)])
+        P, E, D, F = times[0::4], times[1::4], times[2::4], times[3::4]
+
+        classes = self._classes(T, policy)
+        edf = policy != "grm" and policy != "rmus"
+
+        H = lcm(P)
+        boundary = max(F)
+        horizon = boundary + max_hyperperiods * H
+
+        releases = [(F[i], i) for i in range(n)]
+        heapq.heapify(releases)
+
+        ready = list()      # heap of (priority, seq, job)
+        deadlines = list()  # heap of (absolute deadline, seq, job)
+        running = [None] * m
+        seq = 0
+
+        misses = migrations = preemptions = events = 0
+        previous = None
+        steady = False
+        t = 0
+
+        while t < horizon:
+            events += 1
+
+            if t == boundary:
+                state = self._state(ready, running, t)
+                if state == previous:
+                    steady = True
+                    break
+                previous = state
+                boundary += H
+
+            # Releases, job = [priority, task, release, deadline, remaining, core]
+            while releases and releases[0][0] == t:
+                _, i = heapq.heappop(releases)
+                key = t + D[i] if edf else P[i]
+                job = [(classes[i], key, t, i), i, t, t + D[i], E[i], None]
+                heapq.heappush(ready, (job[0], seq, job))
+                heapq.heappush(deadlines, (t + D[i], seq, job))
+                heapq.heappush(releases, (t + P[i], i))
+                seq += 1
+
+            # Deadline misses
+            while deadlines and deadlines[0][0] <= t:
+                _, _, job = heapq.heappop(deadlines)
+                if job[4] > 0:
+                    misses += 1
+
+            if misses and stop_on_miss:
+                break
+
+            # Dispatch: fill free cores, then preempt lowest prioritized running jobs
+            free = [c for c in range(m) if running[c] is None]
+            while free and ready:
+                _, _, job = heapq.heappop(ready)
+                c = job[5] if job[5] in free else free[0]
+                free.remove(c)
+                migrations += self._dispatch(running, c, job)
+
+            while ready:
+                c = max(range(m), key=lambda c: running[c][0])
+                if ready[0][0] >= running[c][0]:
+                    break
+                _, _, job = heapq.heappop(ready)
+                victim = running[c]
+                heapq.heappush(ready, (victim[0], seq, victim))
+                seq += 1
+                preemptions += 1
+                migrations += self._dispatch(running, c, job)
+
+            # Next event: release, completion, deadline or hyperperiod boundary
+            nt = min(horizon, boundary)
+            if releases:
+                nt = min(nt, releases[0][0])
+            if deadlines:
+                nt = min(nt, deadlines[0][0])
+            for job in running:
+                if job is not None:
+                    nt = min(nt, t + job[4])
+
+            for c in range(m):
+                job = running[c]
+                if job is not None:
+                    job[4] -= nt - t
+                    if job[4] == 0:
+                        running[c] = None
+
+            t = nt
+
+        misses += sum(1 for _, _, job in deadlines if job[4] > 0 and job[3] <= t)
+
+        if PROFILER.enabled:
+            PROFILER.count("sim.events", events)
+
+        values = {"policy": policy, "hyperperiod": H / scale}
+
+        return SimulationResult(misses == 0, misses, migrations, preemptions, t / scale, steady, values)
+
+    @staticmethod
+    def _dispatch(running, c: int, job) -> int:
+        """
+        Puts job on core c, returns 1 if the job migrated (ran on another core before)
+        """
+        migrated = 1 if job[5] is not None and job[5] != c else 0
+        job[5] = c
+        running[c] = job
+        return migrated
+
+    @staticmethod
+    def _state(ready, running, t: int):
+        """
+        Returns system state relative to time t (pending jobs with remaining time, last core and running flag)
+        """
+        state = [(job[1], job[2] - t, job[4], job[5], 0) for _, _, job in ready]
+        state += [(job[1], job[2] - t, job[4], job[5], 1) for job in running if job is not None]
+        return sorted(state, key=lambda s: (s[0], s[1]))
@@ -1,39 +1,59 @@
-import numpy
+import math
+from collections import namedtuple
 
 
-class PTask:
+class PTask(namedtuple("PTask", ("p", "e", "fi", "d", "u"))):
     """
-    Periodic Task
-    
+    Periodic Task (immutable)
+
     Parameters:
-    
+
         p:  Period
         e:  Execution Time
         fi: Phase (0 by default)
         d:  (relative) Deadline (p by default)
-        
+
     Attributes:
-    
+
         u:   Utilization (e/p)
         xi:  ld(p) - floor(ld(p)) for Burchard Test
-        pke: (m-1 + sqrt(5m^2 - 6m + 1)/2m) for Adaptive TkC
     """
-    def __init__(self, p: float, e: float, fi: float = 0.0, d: float = None):
-        self.p = p
-        self.e = e
-        self.fi = fi
-        self.d = d if d is not None else p
-        self.u = self.e / self.p
-        self.xi = numpy.log2(self.p) - numpy.floor(numpy.log2(self.p))
-        self.pke = 0
+    __slots__ = ()
+
+    def __new__(cls, p: float, e: float, fi: float = 0.0, d: float = None):
+        return tuple.__new__(cls, (p, e, fi, d if d is not None else p, e / p))
+
+    @property
+    def xi(self) -> float:
+        ld = math.log2(self.p)
+        return ld - math.floor(ld)
+
+    def _replace(self, **changes):
+        """
+        Returns new task with changed parameters (p, e, fi, d), u is recomputed
+        """
+        values = {"p": self.p, "e": self.e, "fi": self.fi, "d": self.d}
+        values.update(changes)
+        return PTask(**values)
+
+    def __reduce__(self):
+        return (PTask, (self.p, self.e, self.fi, self.d))
 
     def __eq__(self, __o: object) -> bool:
-        if self.p == __o.p and self.e == __o.e and self.fi == __o.fi and self.d == __o.d:
-            return True
-        return False
-        
+        if not isinstance(__o, PTask):
+            return NotImplemented
+        return self.p == __o.p and self.e == __o.e and self.fi == __o.fi and self.d == __o.d
+
+    def __ne__(self, __o: object) -> bool:
+        if not isinstance(__o, PTask):
+            return NotImplemented
+        return not self == __o
+
+    def __hash__(self) -> int:
+        return hash((self.p, self.e, self.fi, self.d))
+
     def __str__(self) -> str:
         return f"T({self.p},{self.e})"
-    
+
     def __repr__(self) -> str:
-        return f"T({self.p},{self.e})"
\ No newline at end of file
+        return f"T({self.p},{self.e})"
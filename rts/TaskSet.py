@@ -1,4 +1,20 @@
-import numpy
+import math
+from collections import deque
+
+from .Helpers import integer_scale, lazy_import, urm
+from .Profiler import PROFILER, profiled
+from .Result import Result
+
+numpy = lazy_import("numpy")
+
+# Tolerance for comparing multiples of (float) periods
+EPS = 1e-9
+
+# Max. number of tasks analysed with scalar (pure Python) code, larger sets use numpy
+SCALAR_MAX = 32
+
+# Max. number of elements of one (rows x n) block of transformed periods in the SR test
+SR_MAX_ELEMENTS = 1 << 22
 
 
 class TaskSet:
@@ -12,11 +28,19 @@ class TaskSet:
 
     def __init__(self, *Tasks):
         self.taskset = Tasks
-        self.urm = len(self.taskset) * \
-            (numpy.power(2, 1/len(self.taskset)) - 1)
-        self.u = numpy.sum([task.u for task in self.taskset])
-        self.zeta = numpy.max([task.xi for task in self.taskset]) - \
-            numpy.min([task.xi for task in self.taskset])
+        self.urm = urm(len(self.taskset)) if self.taskset else 1.0
+        self.u = sum(task.u for task in self.taskset)
+        self._zeta = None
+
+    @property
+    def zeta(self):
+        """
+        Returns max(xi) - min(xi) of all tasks of the set (computed on first access)
+        """
+        if self._zeta is None:
+            xi = [task.xi for task in self.taskset]
+            self._zeta = max(xi) - min(xi)
+        return self._zeta
 
     def __len__(self) -> int:
         return len(self.taskset)
@@ -53,6 +77,7 @@ class TaskSet:
 
         return self.zeta == 0
 
+    @profiled
     def sort(self, key: str, desc: bool = False):
         """
         Sort task set by key
@@ -66,6 +91,9 @@ class TaskSet:
 
             TaskSet: with self.taskset sorted by key
         """
+        if PROFILER.enabled:
+            PROFILER.count("sort")
+
         Ttemp = self
         Ttemp.taskset = sorted(
             self.taskset, key=lambda i: getattr(i, key), reverse=desc)
@@ -82,7 +110,8 @@ class TaskSet:
         self.taskset.append(T)
 
     # RMS Tests
-    def ll_test(self) -> bool:
+    @profiled
+    def ll_test(self) -> Result:
         """
         Liu-Layland-Test
 
@@ -92,60 +121,148 @@ class TaskSet:
 
         Returns:
 
-            bool -> True if test (u <= uRM) succeeds
+            Result -> True if test (u <= uRM) succeeds, values u and uRM
         """
-        n = len(self)
-
         u = 0
         for task in self.taskset:
             u += (task.e/task.p)
 
-        print(f"u\t= {round(u, 4)}")
-        print(f"uRM\t= {round(self.urm, 4)}")
-
-        return True if u <= self.urm else False
+        return Result(u <= self.urm, {"u": u, "uRM": self.urm})
     
-    def km_test(self, ll: bool = True, hb: bool = False) -> bool:
+    @profiled
+    def harmonic_chains(self) -> list:
+        """
+        Decomposes task set into the minimum number of harmonic chains.
+
+        In a harmonic chain every period divides the next longer one. Tasks with equal xi
+        (ld(p) - floor(ld(p))) have periods differing by a power of 2, these chains are found first by
+        sorting by xi. They are joined by augmenting paths of the matching "period divides period"
+        (minimum chain cover, Dilworth), e.g. the periods 10, 30 and 90 form one chain. Checking all
+        pairs of periods needs O(n^2) steps.
+
+        Returns:
+
+            list -> [[PTask, ...], ...] chains, tasks of every chain ordered by period
+        """
+        if PROFILER.enabled:
+            PROFILER.count("sort")
+
+        tasks = sorted(self.taskset, key=lambda task: task.p)
+        n = len(tasks)
+        nxt, prv = [None] * n, [None] * n
+
+        # Fast first pass: chains of equal xi (xi close to 1 belongs to the same chain as xi close to 0)
+        order = sorted(range(n), key=lambda i: tasks[i].xi)
+        groups = list()
+        for i in order:
+            if groups and tasks[i].xi - tasks[groups[-1][-1]].xi <= EPS:
+                groups[-1].append(i)
+            else:
+                groups.append([i])
+
+        if len(groups) > 1 and tasks[groups[-1][-1]].xi - tasks[groups[0][0]].xi >= 1 - EPS:
+            groups[0] += groups.pop()
+
+        for group in groups:
+            group.sort()
+            for i, j in zip(group, group[1:]):
+                nxt[i], prv[j] = j, i
+
+        # Successors: j follows i if p_i divides p_j (tasks ordered by period)
+        succ = [list() for _ in range(n)]
+        for i in range(n):
+            for j in range(i + 1, n):
+                r = tasks[j].p / tasks[i].p
+                if abs(r - round(r)) <= EPS * r:
+                    succ[i].append(j)
+
+        # Augmenting paths (breadth first) from every chain tail
+        for root in range(n):
+            if nxt[root] is not None:
+                continue
+
+            came_from = {root: None}
+            queue = deque([root])
+            free = None
+            while queue and free is None:
+                i = queue.popleft()
+                for j in succ[i]:
+                    if prv[j] is None:
+                        free = (i, j)
+                        break
+                    if prv[j] not in came_from:
+                        came_from[prv[j]] = (i, j)
+                        queue.append(prv[j])
+
+            while free is not None:
+                i, j = free
+                free = came_from[i]
+                nxt[i], prv[j] = j, i
+
+        chains = list()
+        for i in range(n):
+            if prv[i] is None:
+                chains.append([tasks[i]])
+                while nxt[i] is not None:
+                    i = nxt[i]
+                    chains[-1].append(tasks[i])
+
+        return chains
+
+    @profiled
+    def km_test(self, ll: bool = True, hb: bool = False) -> Result:
         """
         Kuo-Mok-Test
-        
-        Using Liu-Layland-Test by default, alternatively using Hyperbolic Bound
-        
+
+        Every harmonic chain is treated as a single task with the utilization of the chain.
+        Using Liu-Layland-Test by default (u <= K(2^(1/K) - 1) for K chains), alternatively
+        using Hyperbolic Bound (prod(U_chain + 1) <= 2).
+
         Parameters:
             T: TaskSet  -> task set [Task(p: float, e: float), ...]
             ll: bool    -> use Liu-Layland-Test, True by default
             hb: bool    -> use Hyperbolic Bound, False by default
-            
+
         Returns:
-            bool        -> True if test succeeds
+            Result      -> True if test succeeds, values K and bound
         """
-        pass
-        
+        chains = self.harmonic_chains()
+        K = len(chains)
+
+        if hb:
+            hbk = 1
+            for chain in chains:
+                hbk *= (sum(task.u for task in chain) + 1)
+
+            return Result(hbk <= 2, {"K": K, "Hyp. Bd.": hbk})
+
+        uk = urm(K)
 
-    def rma_test(self) -> bool:
+        return Result(self.u <= uk, {"K": K, "u": self.u, "uRM(K)": uk})
+
+    @profiled
+    def rma_test(self, trace: bool = False) -> Result:
         """
         Rate Monotonous Analysis Test for a given task set.
 
         Parameters:
 
             T: TaskSet -> task set [Task(p: float, e: float), ...]
+            trace: bool -> keep value of every iteration in Result.trace, False by default
 
         Returns:
 
-            bool: True if twcrt < t_pmin
+            Result: True if twcrt < t_pmin, values least prioritized task, iterations and t_wcrt
+                    (iteration stops as soon as t reaches the period of the task)
         """
 
         t_pmin = self.get_min_priority_task()
 
-        print(f"Least prioritized task: {t_pmin}")
-
         tls = list()
 
         t0 = t_pmin.e
         tls.append(t0)
 
-        print(f"t0\t= {t0}")
-
         k = 1
         while True:
             tl1 = t_pmin.e
@@ -153,53 +270,496 @@ class TaskSet:
             for task in self.taskset:
                 if task == t_pmin:
                     continue
-                tl2 += (numpy.ceil(tls[k-1]/task.p) * task.e)
+                tl2 += (math.ceil(tls[k-1]/task.p) * task.e)
             tl_ges = tl1 + tl2
             tls.append(tl_ges)
 
-            print(f"t{k}\t= {tl_ges}")
-
-            if tls[k] == tls[k-1]:
+            if tls[k] == tls[k-1] or tls[k] >= t_pmin.p:
                 break
 
             k += 1
 
-        print(f"=> converges after {len(tls)} iterations")
+        if PROFILER.enabled:
+            PROFILER.count("rma.iterations", len(tls))
 
         twcrt = tls[-1]
 
-        print(f"t_wcrt\t= {twcrt}")
+        values = {"Least prioritized task": t_pmin, "iterations": len(tls), "t_wcrt": twcrt}
+
+        return Result(twcrt < t_pmin.p, values, tls if trace else None)
+
+    @profiled
+    def tda_test(self, reduced: bool = False) -> Result:
+        """
+        Time-Demand-Analysis (Lehoczky-Sha-Ding) using scheduling points.
+
+        The demand of every task is checked at all multiples of the periods of higher prioritized
+        tasks up to its deadline, all points of a task at once (scalar loop for up to SCALAR_MAX
+        tasks). Alternatively the reduced point set of Bini-Buttazzo is used.
+
+        Parameters:
+
+            reduced: bool -> use reduced set of scheduling points, False by default
+
+        Returns:
+
+            Result -> True if demand of every task fits at one of its scheduling points,
+                      value first task whose demand does not fit (None if all fit)
+        """
+        if len(self.taskset) <= SCALAR_MAX:
+            return self._tda_scalar(reduced)
+
+        order, P, E, D = self._rm_arrays()
+
+        for i in range(len(P)):
+            t = self._scheduling_points(P, D, i, reduced)
+
+            if PROFILER.enabled:
+                PROFILER.count("tda.points", len(t))
+
+            if not numpy.any(self._demand(P, E, i, t) <= t):
+                return Result(False, {"failed": self.taskset[order[i]]})
+
+        return Result(True, {"failed": None})
+
+    def _tda_scalar(self, reduced: bool = False) -> Result:
+        """
+        Time-Demand-Analysis without numpy (see tda_test), checks the points of a task in ascending order
+        """
+        if PROFILER.enabled:
+            PROFILER.count("sort")
+
+        tasks = sorted(self.taskset, key=lambda task: task.p)
+
+        for i, task in enumerate(tasks):
+            hp = tasks[:i]
+
+            if reduced:
+                points = {task.d}
+                for h in reversed(hp):
+                    points |= {math.floor(t / h.p + EPS) * h.p for t in points}
+                points.discard(0)
+            else:
+                points = {k * h.p for h in hp + [task] for k in range(1, math.floor(task.d / h.p + EPS) + 1)}
+                points.add(task.d)
+
+            if PROFILER.enabled:
+                PROFILER.count("tda.points", len(points))
+
+            for t in sorted(points):
+                if task.e + sum(math.ceil(t / h.p - EPS) * h.e for h in hp) <= t:
+                    break
+            else:
+                return Result(False, {"failed": task})
+
+        return Result(True, {"failed": None})
+
+    def _rm_arrays(self):
+        """
+        Returns task indices in RM order and periods, execution times and deadlines as arrays in that order
+        """
+        if PROFILER.enabled:
+            PROFILER.count("sort")
+
+        order = sorted(range(len(self.taskset)), key=lambda k: self.taskset[k].p)
+        P = numpy.array([self.taskset[k].p for k in order], dtype=float)
+        E = numpy.array([self.taskset[k].e for k in order], dtype=float)
+        D = numpy.array([self.taskset[k].d for k in order], dtype=float)
+        return order, P, E, D
+
+    @staticmethod
+    def _scheduling_points(P, D, i: int, reduced: bool = False):
+        """
+        Scheduling points of the i-th task in RM order
+
+        Parameters:
+
+            P: array      -> periods in RM order
+            D: array      -> deadlines in RM order
+            i: int        -> position of task
+            reduced: bool -> reduced point set of Bini-Buttazzo, False by default
+
+        Returns:
+
+            array -> sorted scheduling points in (0, D[i]]
+        """
+        if reduced:
+            t = numpy.array([D[i]])
+            for j in range(i - 1, -1, -1):
+                t = numpy.union1d(t, numpy.floor(t / P[j] + EPS) * P[j])
+            return t[t > 0]
+
+        ks = [numpy.arange(1, numpy.floor(D[i] / P[j] + EPS) + 1) * P[j] for j in range(i + 1)]
+        return numpy.union1d(numpy.concatenate(ks), [D[i]])
+
+    @staticmethod
+    def _demand(P, E, i: int, t):
+        """
+        Demand of the i-th task in RM order (and all higher prioritized tasks) at the points t
+        """
+        return E[i] + numpy.ceil(t[:, None] / P[None, :i] - EPS) @ E[:i]
+
+    @profiled
+    def response_times(self, scale: float = 1.0) -> list:
+        """
+        Exact Response Time Analysis for every task of the set (RM priorities)
+
+        Parameters:
+
+            scale: float -> factor applied to every execution time, 1 by default
+
+        Returns:
+
+            list -> worst-case response time per task (order of self.taskset), None if deadline is missed
+        """
+        return self._response_times([task.e * scale for task in self.taskset])
+
+    def _response_times(self, es, r0=None, stop: bool = False, key: str = "p") -> list:
+        """
+        Fixed-point iteration of the RTA for given execution times
+
+        Parameters:
+
+            es: list    -> execution time per task (order of self.taskset)
+            r0: list    -> known lower bounds of the response times used as start values, None by default
+            stop: bool  -> stop at the first task missing its deadline
+            key: str    -> task attribute defining the priority order, "p" (RM) or "d" (DM), "p" by default
+
+        Returns:
+
+            list -> worst-case response time per task, None if deadline is missed
+        """
+        n = len(self.taskset)
+        order = sorted(range(n), key=lambda k: getattr(self.taskset[k], key))
+        R = [None] * n
+        iterations = 0
+
+        for pos, k in enumerate(order):
+            hp = order[:pos]
+            d = self.taskset[k].d
+            t = es[k]
+
+            if r0 is not None and r0[k] is not None and r0[k] > t:
+                t = r0[k]
+
+            while True:
+                iterations += 1
+                tn = es[k]
+                for h in hp:
+                    tn += math.ceil(t / self.taskset[h].p) * es[h]
+
+                if tn > d:
+                    break
+
+                if tn == t:
+                    R[k] = t
+                    break
+
+                t = tn
+
+            if R[k] is None and stop:
+                break
+
+        if PROFILER.enabled:
+            PROFILER.count("sort")
+            PROFILER.count("rta.iterations", iterations)
+
+        return R
+
+    def _schedulable(self, es, r0=None, key: str = "p"):
+        """
+        Returns (bool, response times) of the exact RTA for given execution times
+        """
+        R = self._response_times(es, r0, stop=True, key=key)
+        return all(r is not None for r in R), R
+
+    # Offset analysis
+    def is_offset_free(self) -> bool:
+        """
+        Returns True if all tasks are released simultaneously at some time despite their phases
+        (phases pairwise congruent modulo gcd of the periods, generalized Chinese remainder theorem),
+        then the synchronous analysis is exact and phases cannot be exploited
+        """
+        tasks = self.taskset
+        times, _ = integer_scale([v for task in tasks for v in (task.p, task.fi)])
+        P, F = times[0::2], times[1::2]
+
+        return all((F[k] - F[l]) % math.gcd(P[k], P[l]) == 0 for k in range(len(P)) for l in range(k))
+
+    @profiled
+    def offset_response_times(self) -> list:
+        """
+        Response Time Analysis with static offsets (phases) for every task of the set (RM priorities)
+
+        A level-i busy period starts with the release of a task s of priority >= i (starter). From
+        there, the next release of task k is at least (fi_k - fi_s) mod gcd(p_k, p_s) later, so one
+        scenario per starter (identical reduced offsets merged) is analysed, checking every job of
+        task i in the busy period. Times are converted to integers. The result per task is the
+        minimum of the offset bound and the synchronous response time.
+
+        Returns:
+
+            list -> worst-case response time per task (order of self.taskset), None if deadline may be missed
+        """
+        R = self.response_times()
+
+        if self.is_offset_free():
+            return R
+
+        tasks = self.taskset
+        n = len(tasks)
+        times, scale = integer_scale([v for task in tasks for v in (task.p, task.e, task.d, task.fi)])
+        P, E, D, F = times[0::4], times[1::4], times[2::4], times[3::4]
+
+        order = sorted(range(n), key=lambda k: tasks[k].p)
+        scenarios = iterations = 0
+
+        for pos, i in enumerate(order):
+            hp = order[:pos]
+
+            if sum(E[k] / P[k] for k in hp) + E[i] / P[i] > 1:
+                continue
+
+            offsets = {tuple((F[k] - F[s]) % math.gcd(P[k], P[s]) for k in hp + [i]) for s in hp + [i]}
+            scenarios += len(offsets)
+            worst = 0
+
+            for O in offsets:
+                q = 0
+                w = E[i]
+
+                while worst is not None:
+                    release = O[-1] + q * P[i]
+
+                    while True:
+                        iterations += 1
+                        wn = (q + 1) * E[i] + sum(max(0, -((O[x] - w) // P[k])) * E[k] for x, k in enumerate(hp))
+                        if wn == w or wn - release > D[i]:
+                            break
+                        w = wn
+
+                    if wn - release > D[i]:
+                        worst = None
+                        break
+
+                    worst = max(worst, w - release)
+
+                    if w <= release + P[i]:
+                        break
+
+                    q += 1
+                    w += E[i]
+
+                if worst is None:
+                    break
+
+            if worst is not None and (R[i] is None or worst / scale < R[i]):
+                R[i] = worst / scale
+
+        if PROFILER.enabled:
+            PROFILER.count("sort")
+            PROFILER.count("offset.scenarios", scenarios)
+            PROFILER.count("rta.iterations", iterations)
+
+        return R
+
+    @profiled
+    def offset_test(self) -> Result:
+        """
+        Exact RM schedulability if the task set is offset free, otherwise sufficient test using the
+        Response Time Analysis with offsets (see offset_response_times)
+
+        Returns:
+
+            Result -> True if every response time bound meets its deadline, values response times and offset freedom
+        """
+        R = self.offset_response_times()
+
+        return Result(all(r is not None for r in R), {"R": R, "offset free": self.is_offset_free()})
+
+    # Sensitivity analysis
+    @profiled
+    def critical_scaling_factor(self, tol: float = 1e-6, method: str = "rta") -> float:
+        """
+        Critical scaling factor (largest factor all execution times can be multiplied with while
+        the task set stays RM schedulable).
+
+        Using bisection over the exact RTA by default. The search is bracketed by the Liu-Layland
+        bound (lower, implicit deadlines only) and the utilization/deadline limits (upper). Response
+        times of the last schedulable step are used as start values for the next one.
+
+        Alternatively computed directly from the scheduling points (min_i max_t t / W_i(t)).
+
+        Parameters:
+
+            tol: float  -> relative tolerance of the result (bisection only), 1e-6 by default
+            method: str -> "rta", "points" or "points_reduced", "rta" by default
+
+        Returns:
+
+            float -> critical scaling factor (< 1 if the task set is not schedulable)
+        """
+        if method != "rta":
+            _, P, E, D = self._rm_arrays()
+            csf = numpy.inf
+
+            for i in range(len(P)):
+                t = self._scheduling_points(P, D, i, method == "points_reduced")
+                csf = min(csf, numpy.max(t / self._demand(P, E, i, t)))
+
+            return float(csf)
+
+        es = [task.e for task in self.taskset]
+
+        hi = min(1 / self.u, min(task.d / task.e for task in self.taskset))
+        lo = self.urm / self.u if all(task.d >= task.p for task in self.taskset) else 0
+        lo = min(lo, hi)
+
+        ok, R = self._schedulable([e * hi for e in es])
+        if ok:
+            return hi
+
+        R_lo = None
+        if lo > 0:
+            ok, R = self._schedulable([e * lo for e in es])
+            if ok:
+                R_lo = R
+            else:
+                lo = 0
+
+        while hi - lo > tol * hi:
+            mid = (lo + hi) / 2
+            ok, R = self._schedulable([e * mid for e in es], R_lo)
+
+            if ok:
+                lo, R_lo = mid, R
+            else:
+                hi = mid
+
+        return lo
+
+    @profiled
+    def max_e_growth(self, tol: float = 1e-6, method: str = "rta") -> list:
+        """
+        Maximum growth of the execution time per task (all other tasks unchanged) that keeps the
+        task set RM schedulable.
+
+        Using bisection over the exact RTA by default. The critical scaling factor gives a lower
+        bound ((csf - 1) * e), the slack of the task's own response time an upper bound (d - R)
+        for every bisection.
+
+        Alternatively computed directly from the scheduling points of the task and all lower
+        prioritized tasks.
+
+        Parameters:
+
+            tol: float  -> tolerance relative to the deadline of each task (bisection only), 1e-6 by default
+            method: str -> "rta", "points" or "points_reduced", "rta" by default
+
+        Returns:
+
+            list -> allowed growth of e per task (order of self.taskset), 0 if not schedulable
+        """
+        if method != "rta":
+            return self._points_e_growth(method == "points_reduced")
+
+        es = [task.e for task in self.taskset]
+        ok, R = self._schedulable(es)
+
+        if not ok:
+            return [0.0] * len(es)
+
+        csf = self.critical_scaling_factor(tol)
+        growth = list()
+
+        for k, task in enumerate(self.taskset):
+            lo = (csf - 1) * task.e
+            hi = task.d - R[k]
+            R_lo = R
+
+            es_hi = list(es)
+            es_hi[k] += hi
+            if self._schedulable(es_hi, R)[0]:
+                growth.append(hi)
+                continue
+
+            while hi - lo > tol * task.d:
+                mid = (lo + hi) / 2
+                es_mid = list(es)
+                es_mid[k] += mid
+                ok, R_mid = self._schedulable(es_mid, R_lo)
+
+                if ok:
+                    lo, R_lo = mid, R_mid
+                else:
+                    hi = mid
+
+            growth.append(max(lo, 0.0))
+
+        return growth
+
+    def _points_e_growth(self, reduced: bool = False) -> list:
+        """
+        Maximum growth of e per task from the scheduling points: growing task k by x adds
+        x * ceil(t / p_k) to the demand of every lower prioritized task (x for task k itself)
+        """
+        order, P, E, D = self._rm_arrays()
+        n = len(P)
+        growth = numpy.full(n, numpy.inf)
+
+        for i in range(n):
+            t = self._scheduling_points(P, D, i, reduced)
+            slack = t - self._demand(P, E, i, t)
+
+            if not numpy.any(slack >= 0):
+                return [0.0] * n
+
+            jobs = numpy.ceil(t[:, None] / P[None, :i + 1] - EPS)
+            jobs[:, i] = 1
+            growth[:i + 1] = numpy.minimum(growth[:i + 1], numpy.max(slack[:, None] / jobs, axis=0))
 
-        return True if twcrt < t_pmin.p else False
+        res = [0.0] * n
+        for pos, k in enumerate(order):
+            res[k] = float(growth[pos])
 
-    def hyperbolic_bound(self) -> bool:
+        return res
+
+    @profiled
+    def hyperbolic_bound(self) -> Result:
         """
         Hyperbolic Bound
 
         Returns:
 
-            bool: True if hyperbolic bound of task set < 2
+            Result: True if hyperbolic bound of task set < 2, value hyperbolic bound
         """
         hb = 1
         for task in self.taskset:
             hb *= (task.u + 1)
 
-        print(f"Hyp. Bd. = {hb}")
-        return hb <= 2
+        return Result(hb <= 2, {"Hyp. Bd.": hb})
 
-    def burchard_test(self):
+    @profiled
+    def burchard_test(self) -> Result:
         """
         Burchard Test
+
+        Returns:
+
+            Result: True if u <= U(n, zeta), values u and U(n, zeta)
         """
         n = len(self)
-        U = (n - 1) * (numpy.power(2, self.zeta/(n-1)) - 1) + \
-            numpy.power(2, 1-self.zeta) - 1
 
-        print(f"U(n, zeta) = {U}")
+        if n == 1:
+            U = 1
+        else:
+            U = (n - 1) * (2 ** (self.zeta/(n-1)) - 1) + \
+                2 ** (1-self.zeta) - 1
 
-        return self.u <= U
+        return Result(self.u <= U, {"u": self.u, "U(n, zeta)": U})
 
-    def sr_test(self, stop: bool = False):
+    @profiled
+    def sr_test(self, stop: bool = False, chunk_size: int = None) -> Result:
         """
         Han-Tyan-Test for Distant-Constrained Tasks.
 
@@ -207,59 +767,141 @@ class TaskSet:
 
             From a set of n tasks, n simple periodic task sets result.
 
+        All base periods tbi and the transformed periods of all tasks are computed as one
+        (rows x n) block. For large n the rows are processed in chunks to bound memory; with
+        stop=True the chunks start small and grow, so an early passing transformation saves
+        the remaining work.
+
         Parameters:
 
-            T: TaskSet -> task set [Task(p: float, e: float), ...]
-            stop: bool -> stop after first modified T that passes u < 1 test
+            stop: bool      -> stop after first modified T that passes u < 1 test
+            chunk_size: int -> max. number of transformations per block, bounded by SR_MAX_ELEMENTS by default
 
         Returns:
 
-            dict: {T0: {tbi: float, p_mod: list}, ...} -> for every iteration (every element in the passed task set T)
+            Result: True if one transformation passes, values {
+                tbi: array (k),         -> base period of every transformation
+                p_mod: array (k x n),   -> transformed periods of every transformation
+                u: array (k),           -> utilization of every transformed task set
+                passed: array (k),      -> u < 1 for every transformed task set
+                first: int              -> index of first passing transformation, None if none passes
+            } with k = n (k <= n if stop)
         """
-        tpmin = self.pmin
-        n = len(self)
-        i = 0
+        P = numpy.array([task.p for task in self.taskset], dtype=float)
+        E = numpy.array([task.e for task in self.taskset], dtype=float)
+        n = len(P)
+        pmin = P.min()
 
-        T = self.taskset
-        res = dict()
+        step = chunk_size if chunk_size is not None else max(1, SR_MAX_ELEMENTS // n)
+        size = 1 if stop else step
+
+        tbis, p_mods, us = list(), list(), list()
+        first = None
+        i = 0
 
         while i < n:
-            res[f"T{i}"] = dict()
-            tpi = T[i].p
-            tbi = tpi / 2 ** numpy.ceil(numpy.log2(tpi/tpmin))
-            res[f"T{i}"]["tbi"] = tbi
-            j = 0
-            tpjs = list()
-
-            while j < n:
-                tpj = T[j].p
-                tpj = tbi * 2 ** numpy.floor(numpy.log2(tpj/tbi))
-                tpjs.append(tpj)
-                j += 1
-
-            # Calculate usage
-            res[f"T{i}"]["p_mod"] = tpjs
-            u = numpy.sum([task.e / tpjs[j] for j, task in enumerate(T)])
-            res[f"T{i}"]["u"] = u
-            res[f"T{i}"]["u < 1"] = u < 1
-
-            if stop and u < 1:
+            Pi = P[i:i + size]
+            tbi = Pi / 2 ** numpy.ceil(numpy.log2(Pi / pmin) - EPS)
+            p_mod = tbi[:, None] * 2 ** numpy.floor(numpy.log2(P[None, :] / tbi[:, None]) + EPS)
+            u = (E[None, :] / p_mod).sum(axis=1)
+
+            if stop and numpy.any(u < 1):
+                k = int(numpy.argmax(u < 1)) + 1
+                tbis.append(tbi[:k])
+                p_mods.append(p_mod[:k])
+                us.append(u[:k])
+                first = i + k - 1
                 break
 
-            i += 1
+            tbis.append(tbi)
+            p_mods.append(p_mod)
+            us.append(u)
 
-        return res
+            i += size
+            if stop:
+                size = min(2 * size, step)
+
+        u = numpy.concatenate(us)
+        passed = u < 1
+
+        if first is None and numpy.any(passed):
+            first = int(numpy.argmax(passed))
+
+        values = {
+            "tbi": numpy.concatenate(tbis),
+            "p_mod": numpy.concatenate(p_mods),
+            "u": u,
+            "passed": passed,
+            "first": first
+        }
+
+        return Result(first is not None, values)
 
     # EDF Tests
-    def ult1_test(self) -> bool:
+    @profiled
+    def ult1_test(self) -> Result:
         """
         u < 1 Test for EDF Scheduling
 
         Returns:
 
-            bool: True if u < 1
+            Result: True if u < 1, value u
+        """
+        return Result(self.u < 1, {"u": self.u})
+
+    @profiled
+    def qpa_test(self) -> Result:
+        """
+        Quick Processor-demand Analysis (Zhang-Burns) for EDF Scheduling with arbitrary deadlines
+
+        Returns:
+
+            Result: True if processor demand h(t) <= t for every absolute deadline t, value u
         """
-        return self.u < 1
+        values = {"u": self.u}
+
+        if self.u > 1:
+            return Result(False, values)
+
+        tasks = self.taskset
+
+        if all(task.d >= task.p for task in tasks):
+            return Result(True, values)
+
+        # Synchronous busy period
+        L = sum(task.e for task in tasks)
+        while True:
+            Ln = sum(math.ceil(L / task.p - EPS) * task.e for task in tasks)
+            if Ln == L:
+                break
+            L = Ln
+
+        if self.u < 1:
+            La = max(max(task.d for task in tasks), sum((task.p - task.d) * task.u for task in tasks) / (1 - self.u))
+            L = min(L, La)
+
+        dmin = min(task.d for task in tasks)
+
+        def h(t):
+            return sum((math.floor((t - task.d) / task.p + EPS) + 1) * task.e for task in tasks if task.d <= t)
+
+        def deadline_before(t):
+            ds = [task.d + (math.ceil((t - task.d) / task.p) - 1) * task.p for task in tasks if task.d < t]
+            return max(ds) if ds else None
+
+        t = deadline_before(L)
+
+        while t is not None:
+            ht = h(t)
+
+            if ht > t:
+                return Result(False, values)
+            if ht <= dmin:
+                return Result(True, values)
+
+            t = ht if ht < t else deadline_before(t)
+
+        return Result(True, values)
 
     @property
     def pmin(self):
@@ -0,0 +1,122 @@
+from .Processor import Processor
+from .Profiler import profiled
+from .Result import Result
+
+
+class UniformProcessor(Processor):
+    """
+    Multi-Core Processor with uniform cores of different speed (a task with execution time e needs
+    e/s on a core with speed s, the utilization of a core is sum(u)/s)
+
+    By default the cores are numbered by decreasing speed (C1 fastest), so first fit tries the
+    fastest core first and procedures ordering by decreasing utilization place the largest task
+    onto the fastest feasible core.
+
+    Parameters:
+
+        speeds: list        -> speed factor per core
+        fastest_first: bool -> number cores by decreasing speed, True by default (given order otherwise)
+    """
+    def __init__(self, speeds, fastest_first: bool = True):
+        if not speeds or any(s <= 0 for s in speeds):
+            raise ValueError("Speeds must be positive")
+
+        super().__init__(len(speeds))
+        self.speeds = [float(s) for s in (sorted(speeds, reverse=True) if fastest_first else speeds)]
+        self.prepare(self.core_count)
+
+    def prepare(self, cc):
+        """
+        Creates empty partitioning table for Processor (with speed per core)
+
+        Parameters:
+
+            cc: int -> core_count of Processor
+        """
+        super().prepare(cc)
+
+        for i in range(cc):
+            self.core_dict[f"C{i+1}"]["speed"] = self.speeds[i]
+
+    @property
+    def capacity(self) -> float:
+        """
+        Returns total speed of all cores
+        """
+        return sum(self.speeds)
+
+    @profiled
+    def global_edf(self, T) -> Result:
+        """
+        Global Earliest Deadline First on uniform cores (Funk-Goossens-Baruah):
+        u <= S - lambda * umax with S total speed and lambda = max_j sum(s_k, k > j) / s_j
+        (speeds in decreasing order)
+
+        Parameters:
+
+            T: TaskSet -> task set that should be scheduled
+
+        Returns:
+
+            Result -> True if scheduling was successful, bound values
+        """
+        self.reset()
+
+        speeds = sorted(self.speeds, reverse=True)
+        S = sum(speeds)
+        lam = max(sum(speeds[j+1:]) / speeds[j] for j in range(len(speeds)))
+        umax = max(task.u for task in T.taskset)
+
+        u = S - lam * umax
+
+        return Result(T.u <= u, {"u": u, "Tu": T.u, "S": S, "lambda": lam})
+
+    def simulate(self, T, policy: str = "gedf", max_hyperperiods: int = 10, stop_on_miss: bool = False):
+        """
+        Not defined for uniform cores: the Simulator runs every job at speed 1 on identical cores
+
+        Raises:
+
+            ValueError -> always (use Processor)
+        """
+        raise ValueError("simulate is only defined for identical cores (use Processor)")
+
+    def adaptive_tkc(self, T) -> Result:
+        """
+        Not defined for uniform cores: the TkC bound Us is derived for m identical cores
+
+        Raises:
+
+            ValueError -> always (use Processor)
+        """
+        raise ValueError("adaptive_tkc is only defined for identical cores (use Processor)")
+
+    def rmus(self, T) -> Result:
+        """
+        Not defined for uniform cores: the separation value m/(3m-2) is derived for m identical cores
+
+        Raises:
+
+            ValueError -> always (use Processor)
+        """
+        raise ValueError("rmus is only defined for identical cores (use Processor)")
+
+    def edfus(self, T) -> Result:
+        """
+        Not defined for uniform cores: the separation value m/(2m-1) is derived for m identical cores
+
+        Raises:
+
+            ValueError -> always (use Processor)
+        """
+        raise ValueError("edfus is only defined for identical cores (use Processor)")
+
+    def fpedf(self, T) -> Result:
+        """
+        Not defined for uniform cores: the bound (m+1)/2 is derived for m identical cores
+
+        Raises:
+
+            ValueError -> always (use Processor)
+        """
+        raise ValueError("fpedf is only defined for identical cores (use Processor)")